@@ -2,54 +2,22 @@ from __future__ import annotations
 
 """audio.py
 
-외부 파일 없이 BGM 루프 생성.
+외부 파일 없이 BGM 루프 생성 (생성 결과는 audio_cache 에 저장해 다음 실행부터 재사용).
 mixer 실패 환경에서도 조용히 disable.
 """
 
-import math
-from array import array
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional
 import pygame
 
+from audio_cache import cached_pcm
+from synth import TONE_PARTIALS, tone_steps
+
 
 def _clamp(x: float, a: float, b: float) -> float:
     return a if x < a else b if x > b else x
 
 
-def _sine(freq: float, t: float) -> float:
-    return math.sin(2.0 * math.pi * freq * t)
-
-
-def _make_step(freqs: list[float], sec: float, sr: int, gain: float, fade: float = 0.020) -> list[int]:
-    n = max(1, int(sr * sec))
-    fade_n = int(sr * fade)
-    if fade_n * 2 > n:
-        fade_n = n // 2
-
-    mix_div = max(1, len(freqs))
-    out: list[int] = []
-    amp = int(32767 * _clamp(gain, 0.0, 1.0))
-
-    for i in range(n):
-        t = i / sr
-        s = 0.0
-        for f in freqs:
-            s += _sine(f, t) * 0.75
-            s += _sine(f * 2.0, t) * 0.25
-        s /= mix_div
-
-        if fade_n > 0:
-            if i < fade_n:
-                s *= (i / fade_n)
-            elif i > n - fade_n:
-                s *= ((n - i) / fade_n)
-
-        out.append(int(amp * s))
-
-    return out
-
-
 def _hz(note: str) -> float:
     note = note.strip().upper()
     names = {
@@ -81,25 +49,62 @@ def _hz(note: str) -> float:
     return 440.0 * (2.0 ** ((midi - 69) / 12.0))
 
 
-def build_bgm_loop(sr: int = 44100) -> bytes:
-    chords = [
-        ["C4", "E4", "G4", "B4"],
-        ["A3", "C4", "E4", "G4"],
-        ["F3", "A3", "C4", "E4"],
-        ["G3", "C4", "D4", "G4"],
-    ]
-    step_sec = 0.25
-    arp = [0, 2, 1, 2, 3, 2, 1, 2]
-
-    samples: list[int] = []
-    for chord in chords:
+BGM_CHORDS = [
+    ["C4", "E4", "G4", "B4"],
+    ["A3", "C4", "E4", "G4"],
+    ["F3", "A3", "C4", "E4"],
+    ["G3", "C4", "D4", "G4"],
+]
+BGM_ARP = [0, 2, 1, 2, 3, 2, 1, 2]
+BGM_STEP_SEC = 0.25
+BGM_GAIN = 0.22
+BGM_FADE_SEC = 0.020
+
+
+def bgm_params(sr: int = 44100) -> Dict[str, Any]:
+    """build_bgm_loop 결과를 결정하는 값 전부 (audio_cache 키)."""
+    return {
+        "chords": BGM_CHORDS,
+        "arp": BGM_ARP,
+        "step_sec": BGM_STEP_SEC,
+        "gain": BGM_GAIN,
+        "fade_sec": BGM_FADE_SEC,
+        "partials": TONE_PARTIALS,
+        "sr": sr,
+    }
+
+
+def bgm_steps() -> list[list[float]]:
+    """코드 × 아르페지오 순서대로 스텝별 주파수 (루트 + 한 옥타브 아래)."""
+    steps: list[list[float]] = []
+    for chord in BGM_CHORDS:
         hz = [_hz(n) for n in chord]
-        for idx in arp:
+        for idx in BGM_ARP:
             root = hz[idx]
-            freqs = [root, root / 2.0]
-            samples.extend(_make_step(freqs=freqs, sec=step_sec, sr=sr, gain=0.22))
+            steps.append([root, root / 2.0])
+    return steps
+
 
-    return array("h", samples).tobytes()
+def build_bgm_loop(sr: int = 44100) -> bytes:
+    steps = bgm_steps()
+    n = max(1, int(sr * BGM_STEP_SEC))
+    fade_n = int(sr * BGM_FADE_SEC)
+    return tone_steps(steps, n=n, sr=sr, gain=BGM_GAIN, fade_n=fade_n).tobytes()
+
+
+def init_bgm_channel() -> Optional[pygame.mixer.Channel]:
+    """mixer 초기화 + 채널 0 예약(BGM 전용). 실패하면 None."""
+    try:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(44100, -16, 1, 512)
+        pygame.mixer.set_num_channels(8)
+        try:
+            pygame.mixer.set_reserved(1)
+        except Exception:
+            pass
+        return pygame.mixer.Channel(0)
+    except Exception:
+        return None
 
 
 @dataclass
@@ -111,32 +116,34 @@ class BgmPlayer:
     _sound: Optional[pygame.mixer.Sound] = None
     _channel: Optional[pygame.mixer.Channel] = None
 
-    def init(self) -> None:
-        try:
-            if not pygame.mixer.get_init():
-                pygame.mixer.init(44100, -16, 1, 512)
-            pygame.mixer.set_num_channels(8)
-            try:
-                pygame.mixer.set_reserved(1)
-            except Exception:
-                pass
-        except Exception:
+    def init(self, build: bool = True) -> None:
+        """mixer/채널 준비. build=False 면 버퍼는 나중에 attach() (audio_loader 가 백그라운드 생성)."""
+        self._channel = init_bgm_channel()
+        if self._channel is None:
             self.enabled = False
             self._sound = None
-            self._channel = None
             return
 
         self.enabled = True
-        self._channel = pygame.mixer.Channel(0)
 
-        try:
-            loop_bytes = build_bgm_loop(sr=44100)
-            self._sound = pygame.mixer.Sound(buffer=loop_bytes)
-        except Exception:
-            self._sound = None
-            self.enabled = False
-            return
+        if build:
+            try:
+                with cached_pcm("bgm", bgm_params(44100), lambda: build_bgm_loop(sr=44100)) as buf:
+                    self.attach(buf)
+            except Exception:
+                self._sound = None
+                self.enabled = False
+
+    def build_pcm(self) -> bytes:
+        """워커 스레드에서 호출 (pygame 호출 없음)."""
+        with cached_pcm("bgm", bgm_params(44100), lambda: build_bgm_loop(sr=44100)) as buf:
+            return bytes(buf)
 
+    def attach(self, buf) -> None:
+        """메인 스레드: 버퍼로 Sound 를 만들고 그때까지 바뀐 on/volume 그대로 재생 시작."""
+        if not self.enabled:
+            return
+        self._sound = pygame.mixer.Sound(buffer=buf)
         self.apply()
 
     def apply(self) -> None:
@@ -168,6 +175,9 @@ class BgmPlayer:
         self.volume = _clamp(float(v), 0.0, 1.0)
         self.apply()
 
+    def update(self, score: int) -> None:
+        """루프 재생이라 프레임마다 할 일 없음 (BgmSequencer 와 같은 인터페이스)."""
+
     def stop(self) -> None:
         self.on = False
         self.apply()
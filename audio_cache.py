@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+"""audio_cache.py
+
+생성한 PCM 버퍼 디스크 캐시 (content-addressed).
+- key = sha256(종류 + 합성 파라미터 + synth.SYNTH_VERSION) → 파라미터가 바뀌면 자동으로 다른 파일
+- <dir>/<key>.pcm: 헤더(매직 + 길이) + int16 PCM, 임시 파일 + os.replace 로 기록
+- 읽을 때 mmap → memoryview 로 복사 없이 pygame.mixer.Sound(buffer=...) 에 넘김
+- 전체 크기가 한도를 넘으면 오래 안 쓴(mtime) 파일부터 삭제
+- 디스크 오류는 조용히 무시하고 메모리에서 생성
+"""
+
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+import config
+from synth import SYNTH_VERSION
+
+Buffer = Union[bytes, memoryview]
+
+_MAGIC = b"OMBPCM1\0"
+_HEADER = struct.Struct("<8sQ")  # magic, data bytes
+_SUFFIX = ".pcm"
+
+
+def cache_key(kind: str, params: Dict[str, Any]) -> str:
+    blob = json.dumps(
+        {"kind": kind, "synth": SYNTH_VERSION, "params": params},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    def __init__(self, root: Union[str, Path], max_bytes: int) -> None:
+        self.root = Path(root)
+        self.max_bytes = max(0, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.root / (key + _SUFFIX)
+
+    def _map(self, key: str) -> Optional[mmap.mmap]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < _HEADER.size:
+                    return None
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        magic, n = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC or n != size - _HEADER.size:
+            mm.close()
+            return None
+        try:
+            os.utime(path)  # LRU 용 사용 시각
+        except OSError:
+            pass
+        return mm
+
+    def _store(self, key: str, data: bytes) -> None:
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp = path.with_name(path.name + ".tmp")
+            with open(tmp, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, len(data)))
+                f.write(data)
+            os.replace(tmp, path)
+            self.prune(keep=key)
+        except OSError:
+            pass
+
+    @contextlib.contextmanager
+    def open(self, key: str, build: Callable[[], bytes]) -> Iterator[Buffer]:
+        """with cache.open(key, build) as buf: Sound(buffer=buf)
+
+        hit 면 mmap 위 memoryview (with 블록 밖에선 못 씀), miss 면 build() 결과를 저장하고 그대로.
+        """
+        mm = self._map(key)
+        if mm is None:
+            self.misses += 1
+            data = build()
+            self._store(key, data)
+            yield data
+            return
+
+        self.hits += 1
+        view = memoryview(mm)
+        pcm = view[_HEADER.size:]
+        try:
+            yield pcm
+        finally:
+            pcm.release()
+            view.release()
+            mm.close()
+
+    def total_bytes(self) -> int:
+        total = 0
+        for p in self.root.glob("*" + _SUFFIX):
+            try:
+                total += p.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def prune(self, keep: Optional[str] = None) -> int:
+        """max_bytes 까지 오래된 것부터 삭제. 지운 개수 반환."""
+        files = []
+        for p in self.root.glob("*" + _SUFFIX):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, p))
+
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for _, size, p in sorted(files, key=lambda x: x[0]):
+            if total <= self.max_bytes:
+                break
+            if keep is not None and p.stem == keep:
+                continue
+            try:
+                p.unlink()
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def clear(self) -> None:
+        for p in self.root.glob("*" + _SUFFIX):
+            try:
+                p.unlink()
+            except OSError:
+                pass
+
+
+_cache: Optional[AudioCache] = None
+
+
+def get_cache() -> Optional[AudioCache]:
+    """config.AUDIO_CACHE 가 꺼져 있으면 None."""
+    global _cache
+    if not config.AUDIO_CACHE:
+        return None
+    if _cache is None:
+        _cache = AudioCache(config.AUDIO_CACHE_DIR, config.AUDIO_CACHE_MAX_BYTES)
+    return _cache
+
+
+@contextlib.contextmanager
+def cached_pcm(kind: str, params: Dict[str, Any], build: Callable[[], bytes]) -> Iterator[Buffer]:
+    """캐시가 있으면 거치고, 없으면 build() 그대로."""
+    cache = get_cache()
+    if cache is None:
+        yield build()
+        return
+    with cache.open(cache_key(kind, params), build) as buf:
+        yield buf
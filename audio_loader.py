@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+"""audio_loader.py
+
+BGM/SFX 버퍼를 워커 스레드에서 만들고 메인 루프에서 꽂아 넣음(hot-swap).
+- 첫 프레임이 합성/캐시 로드를 기다리지 않음
+- 워커는 bytes 만 만듦 (pygame 호출 없음), Sound 생성/재생은 poll() 에서 메인 스레드로
+- 버퍼가 오기 전 on/volume 변경은 플레이어 필드에 남아 있다가 attach 때 그대로 적용,
+  play_click 은 그동안 무시
+- 워커는 시작 후에도 살아 있음: submit(build, on_done) 으로 스트리밍 BGM 청크 합성도 같은 워커에서
+"""
+
+import queue
+import threading
+from typing import Callable, Dict, List, Optional, Protocol, Tuple
+
+
+class AsyncAudio(Protocol):
+    enabled: bool
+
+    def build_pcm(self) -> bytes: ...
+
+    def attach(self, buf) -> None: ...
+
+
+# on_done(data): 메인 스레드에서 호출, 실패면 data = None
+Callback = Callable[[Optional[bytes]], None]
+
+
+class AudioLoader:
+    def __init__(self, players: List[AsyncAudio]) -> None:
+        # mixer 초기화에 실패한 플레이어는 만들 필요 없음
+        self._players = [p for p in players if p.enabled]
+        self._jobs: "queue.Queue[Tuple[int, Callable[[], bytes]]]" = queue.Queue()
+        self._results: "queue.Queue[Tuple[int, Optional[bytes]]]" = queue.Queue()
+        self._callbacks: Dict[int, Callback] = {}
+        self._next_id = 0
+        self._thread: Optional[threading.Thread] = None
+        self._background = True
+        self._remaining = len(self._players)
+
+    @property
+    def done(self) -> bool:
+        """시작 때 넘긴 플레이어 버퍼가 다 붙었는지 (submit 작업과는 무관)."""
+        return self._remaining == 0
+
+    def start(self, background: bool = True) -> None:
+        self._background = background
+        for p in self._players:
+            self.submit(p.build_pcm, lambda data, p=p: self._attach(p, data))
+
+    def submit(self, build: Callable[[], bytes], on_done: Callback) -> None:
+        """build() 를 워커에서 돌리고, 결과는 다음 poll() 에서 on_done 으로. 백그라운드가 아니면 바로 실행."""
+        if not self._background:
+            on_done(_safe_build(build))
+            return
+
+        job_id = self._next_id
+        self._next_id += 1
+        self._callbacks[job_id] = on_done
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="audio-loader", daemon=True)
+            self._thread.start()
+        self._jobs.put((job_id, build))
+
+    def _run(self) -> None:
+        while True:
+            job_id, build = self._jobs.get()
+            self._results.put((job_id, _safe_build(build)))
+
+    def _attach(self, p: AsyncAudio, data: Optional[bytes]) -> None:
+        self._remaining -= 1
+        if data is None:
+            p.enabled = False
+            return
+        try:
+            p.attach(data)
+        except Exception:
+            p.enabled = False
+
+    def poll(self) -> int:
+        """메인 루프에서 매 프레임: 끝난 작업의 콜백 실행. 처리한 개수 반환."""
+        n = 0
+        while self._callbacks:
+            try:
+                job_id, data = self._results.get_nowait()
+            except queue.Empty:
+                break
+            on_done = self._callbacks.pop(job_id)
+            on_done(data)
+            n += 1
+        return n
+
+
+def _safe_build(build: Callable[[], bytes]) -> Optional[bytes]:
+    try:
+        return build()
+    except Exception:
+        return None
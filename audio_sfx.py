@@ -2,33 +2,84 @@ from __future__ import annotations
 
 """audio_sfx.py
 
-(2) PERFECT 클릭 SFX (외부 파일 없이 생성)
+(2) PERFECT 클릭 SFX (외부 파일 없이 생성, audio_cache 재사용)
+- 콤보 단계별 피치 변형을 init 때 한 번에 합성 (재생 중엔 합성 없음)
+- 채널 1~7 voice pool: 빈 채널 우선, 없으면 가장 오래된 voice 를 뺏음
 """
 
-import math
-from array import array
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 import pygame
 
+from audio_cache import cached_pcm
+from synth import decay_partials, decay_partials_bank
+
+# (Hz, 세기)
+CLICK_PARTIALS = ((1200.0, 1.0), (2400.0, 0.35), (8000.0, 0.06))
+CLICK_DECAY = 45.0
+CLICK_GAIN = 0.55
+
+# perfect_combo 1, 2, 3 … 마다 반음 단위로 올림 (장음계, 마지막 단계에서 유지)
+CLICK_PITCH_STEPS = (0, 2, 4, 5, 7, 9, 11, 12)
+
 
 def _clamp(x: float, a: float, b: float) -> float:
     return a if x < a else b if x > b else x
 
 
+def click_params(sr: int = 44100, dur: float = 0.06) -> Dict[str, Any]:
+    return {"partials": CLICK_PARTIALS, "decay": CLICK_DECAY, "gain": CLICK_GAIN, "sr": sr, "dur": dur}
+
+
 def build_click_sfx(sr: int = 44100, dur: float = 0.06) -> bytes:
     n = max(1, int(sr * dur))
-    out = array("h")
+    return decay_partials(CLICK_PARTIALS, n=n, sr=sr, decay=CLICK_DECAY, gain=CLICK_GAIN).tobytes()
+
 
-    for i in range(n):
-        t = i / sr
-        env = math.exp(-t * 45.0)
-        s = math.sin(2.0 * math.pi * 1200.0 * t) * env
-        s += math.sin(2.0 * math.pi * 2400.0 * t) * env * 0.35
-        s += math.sin(2.0 * math.pi * 8000.0 * t) * env * 0.06
-        out.append(int(_clamp(s, -1.0, 1.0) * 32767 * 0.55))
+def click_bank_params(sr: int = 44100, dur: float = 0.06) -> Dict[str, Any]:
+    p = click_params(sr, dur)
+    p["pitch_steps"] = CLICK_PITCH_STEPS
+    return p
 
-    return out.tobytes()
+
+def build_click_bank(sr: int = 44100, dur: float = 0.06) -> bytes:
+    """CLICK_PITCH_STEPS 변형 전부를 한 번에 합성, 같은 길이로 이어 붙임 (0 번은 build_click_sfx 와 동일)."""
+    n = max(1, int(sr * dur))
+    ratios = [2.0 ** (k / 12.0) for k in CLICK_PITCH_STEPS]
+    bank = decay_partials_bank(CLICK_PARTIALS, ratios, n=n, sr=sr, decay=CLICK_DECAY, gain=CLICK_GAIN)
+    return b"".join(a.tobytes() for a in bank)
+
+
+class VoicePool:
+    """SFX 채널 묶음. 빈 채널 우선, 다 차 있으면 가장 오래 전에 시작한 voice 를 끊고 재사용."""
+
+    def __init__(self, channels: List[pygame.mixer.Channel]) -> None:
+        self.channels = channels
+        self._started = [0] * len(channels)  # 시작 순번 (작을수록 오래됨)
+        self._seq = 0
+        self.steals = 0
+
+    def set_volume(self, v: float) -> None:
+        for ch in self.channels:
+            ch.set_volume(v)
+
+    def play(self, sound: pygame.mixer.Sound) -> int:
+        """재생한 채널 인덱스 반환."""
+        idx = -1
+        oldest = 0
+        for i, ch in enumerate(self.channels):
+            if not ch.get_busy():
+                idx = i
+                break
+            if idx < 0 or self._started[i] < oldest:
+                idx, oldest = i, self._started[i]
+        else:
+            self.steals += 1
+
+        self._seq += 1
+        self._started[idx] = self._seq
+        self.channels[idx].play(sound)
+        return idx
 
 
 @dataclass
@@ -36,42 +87,65 @@ class SfxPlayer:
     enabled: bool = False
     volume: float = 0.45
 
-    _sound_click: Optional[pygame.mixer.Sound] = None
-    _ch: Optional[pygame.mixer.Channel] = None
+    _bank: List[pygame.mixer.Sound] = field(default_factory=list)
+    _voices: Optional[VoicePool] = None
 
-    def init(self) -> None:
+    def init(self, build: bool = True) -> None:
+        """build=False 면 클릭 묶음은 나중에 attach() — 그 전까지 play_click 은 무시."""
         try:
             if not pygame.mixer.get_init():
                 pygame.mixer.init(44100, -16, 1, 512)
             pygame.mixer.set_num_channels(8)
+            # 채널 0 은 BGM 예약
+            channels = [pygame.mixer.Channel(i) for i in range(1, pygame.mixer.get_num_channels())]
         except Exception:
             self.enabled = False
             return
 
-        self.enabled = True
-        self._ch = pygame.mixer.Channel(1)
-
-        try:
-            self._sound_click = pygame.mixer.Sound(buffer=build_click_sfx())
-        except Exception:
-            self._sound_click = None
+        if not channels:
             self.enabled = False
             return
 
+        self.enabled = True
+        self._voices = VoicePool(channels)
         self.apply()
 
+        if build:
+            try:
+                with cached_pcm("click_bank", click_bank_params(), build_click_bank) as buf:
+                    self.attach(buf)
+            except Exception:
+                self._bank = []
+                self.enabled = False
+
+    def build_pcm(self) -> bytes:
+        """워커 스레드에서 호출 (pygame 호출 없음)."""
+        with cached_pcm("click_bank", click_bank_params(), build_click_bank) as buf:
+            return bytes(buf)
+
+    def attach(self, buf) -> None:
+        """이어 붙은 변형들을 같은 길이로 잘라 Sound 묶음으로."""
+        if not self.enabled:
+            return
+        data = memoryview(buf)
+        k = len(CLICK_PITCH_STEPS)
+        size = len(data) // k
+        self._bank = [pygame.mixer.Sound(buffer=data[i * size:(i + 1) * size]) for i in range(k)]
+
     def apply(self) -> None:
-        if not self.enabled or self._ch is None:
+        if not self.enabled or self._voices is None:
             return
         try:
-            self._ch.set_volume(_clamp(self.volume, 0.0, 1.0))
+            self._voices.set_volume(_clamp(self.volume, 0.0, 1.0))
         except Exception:
             pass
 
-    def play_click(self) -> None:
-        if not self.enabled or self._ch is None or self._sound_click is None:
+    def play_click(self, combo: int = 1) -> None:
+        """combo(perfect_combo) 단계만큼 높은 음. 합성 없음, 미리 만든 묶음에서 고르기만."""
+        if not self.enabled or self._voices is None or not self._bank:
             return
+        level = max(0, min(int(combo) - 1, len(self._bank) - 1))
         try:
-            self._ch.play(self._sound_click)
+            self._voices.play(self._bank[level])
         except Exception:
             pass
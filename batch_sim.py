@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+"""batch_sim.py
+
+NumPy 배치 시뮬레이터.
+- N개의 독립 런을 배열로 동시에 진행 (Block 객체 없음)
+- update.update_game 의 move/drop/trim/perfect, mechanics.compute_overlap 을 배열 연산으로 재구현
+- MIN_OVERLAP_RATIO / PERFECT_RATIO / COMBO_WIDTH_BONUS 몬테카를로용
+  (파라미터는 스칼라 또는 런별 (N,) 배열 모두 가능)
+
+drop 단계는 x 가 고정이라 결과가 낙하 시간과 무관 → 드랍 즉시 착지 판정.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+import config
+
+ArrayLike = Union[float, np.ndarray]
+
+# policy(sim) -> (N,) bool 마스크, True 인 런은 이번 프레임에 드랍
+BatchPolicy = Callable[["BatchSimulator"], np.ndarray]
+
+
+@dataclass
+class BatchResult:
+    score: np.ndarray
+    perfect: np.ndarray
+    max_combo: np.ndarray
+    frames: int
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "runs": float(self.score.size),
+            "score_mean": float(self.score.mean()),
+            "score_p50": float(np.percentile(self.score, 50)),
+            "score_p90": float(np.percentile(self.score, 90)),
+            "perfect_mean": float(self.perfect.mean()),
+            "max_combo_mean": float(self.max_combo.mean()),
+        }
+
+
+def aligned_policy(tolerance: float = 6.0) -> BatchPolicy:
+    """simulator.aligned_policy 의 배치 버전."""
+    def _policy(sim: "BatchSimulator") -> np.ndarray:
+        cur_c = sim.cur_x + sim.cur_w * 0.5
+        top_c = sim.top_x + sim.top_w * 0.5
+        return np.abs(cur_c - top_c) <= tolerance
+
+    return _policy
+
+
+def jitter_policy(sigma: float = 12.0, seed: Optional[int] = None) -> BatchPolicy:
+    """블록마다 목표 오차(정규분포)를 뽑고, 그 위치에 오면 드랍 → 사람 손 흉내."""
+    rng = np.random.default_rng(seed)
+
+    def _policy(sim: "BatchSimulator") -> np.ndarray:
+        err = sim.aux.get("aim_err")
+        if err is None:
+            err = sim.aux["aim_err"] = rng.normal(0.0, sigma, sim.n)
+        fresh = sim.hold == 0
+        if fresh.any():
+            err[fresh] = rng.normal(0.0, sigma, int(fresh.sum()))
+
+        cur_c = sim.cur_x + sim.cur_w * 0.5
+        top_c = sim.top_x + sim.top_w * 0.5 + err
+        return np.abs(cur_c - top_c) <= sim.step_px * 0.5
+
+    return _policy
+
+
+class BatchSimulator:
+    """N 런을 (N,) 배열로 들고 프레임 단위로 진행."""
+
+    def __init__(
+        self,
+        n: int,
+        screen_w: int = config.WINDOW_W,
+        dt: float = 1.0 / config.SIM_HZ,
+        seed: Optional[int] = None,
+        min_overlap_ratio: ArrayLike = config.MIN_OVERLAP_RATIO,
+        perfect_ratio: ArrayLike = config.PERFECT_RATIO,
+        combo_every: int = config.COMBO_REWARD_EVERY,
+        combo_bonus: ArrayLike = config.COMBO_WIDTH_BONUS,
+        horizontal_speed: float = config.HORIZONTAL_SPEED,
+        edge_padding: int = config.EDGE_PADDING,
+        max_hold: float = 4.0,
+    ) -> None:
+        self.n = int(n)
+        self.screen_w = float(screen_w)
+        self.dt = float(dt)
+        self.rng = np.random.default_rng(seed)
+
+        self.min_overlap_ratio = np.broadcast_to(np.asarray(min_overlap_ratio, dtype=np.float64), (self.n,))
+        self.perfect_ratio = np.broadcast_to(np.asarray(perfect_ratio, dtype=np.float64), (self.n,))
+        self.combo_bonus = np.broadcast_to(np.asarray(combo_bonus, dtype=np.int64), (self.n,))
+        self.combo_every = max(1, int(combo_every))
+        self.horizontal_speed = float(horizontal_speed)
+        self.edge_padding = float(edge_padding)
+        self.max_hold_frames = max(1, int(round(max_hold / self.dt)))
+        self.step_px = self.horizontal_speed * self.dt
+
+        self.reset()
+
+    def reset(self) -> None:
+        n = self.n
+        w0 = min(280.0, self.screen_w - self.edge_padding * 2)
+
+        self.top_x = np.full(n, (self.screen_w - w0) / 2)
+        self.top_w = np.full(n, w0)
+
+        self.cur_x = np.zeros(n)
+        self.cur_w = np.zeros(n)
+        self.vx = np.zeros(n)
+
+        self.score = np.zeros(n, dtype=np.int64)
+        self.combo = np.zeros(n, dtype=np.int64)
+        self.perfect = np.zeros(n, dtype=np.int64)
+        self.max_combo = np.zeros(n, dtype=np.int64)
+        self.width_bonus = np.zeros(n, dtype=np.int64)
+        self.hold = np.zeros(n, dtype=np.int64)
+        self.alive = np.ones(n, dtype=bool)
+        self.frames = 0
+
+        # policy 가 쓰는 런별 보조 배열(압축 시 같이 잘림)
+        self.aux: Dict[str, np.ndarray] = {}
+        # 압축으로 빠진 런의 결과는 원래 인덱스(ids) 자리에 기록
+        self.ids = np.arange(n)
+        self._out_score = np.zeros(n, dtype=np.int64)
+        self._out_perfect = np.zeros(n, dtype=np.int64)
+        self._out_max_combo = np.zeros(n, dtype=np.int64)
+
+        self._spawn(np.arange(n))
+
+    def _spawn(self, idx: np.ndarray) -> None:
+        """spawner.spawn_next_block 배열 버전."""
+        if idx.size == 0:
+            return
+        k = idx.size
+        top_w = self.top_w[idx]
+
+        w = np.clip(top_w, 60.0, 360.0)
+        w = np.maximum(60.0, w + self.rng.integers(-18, 19, k))
+
+        bonus = self.width_bonus[idx]
+        has_bonus = bonus != 0
+        w = np.where(has_bonus, np.minimum(420.0, w + bonus), w)
+        self.width_bonus[idx] = 0
+
+        center_x = self.top_x[idx] + top_w / 2
+
+        max_off = (self.screen_w - self.edge_padding * 2 - w) / 2
+        max_off = np.clip(max_off.astype(np.int64), 0, 120)
+        # randint(-m, m) 균등 정수
+        off = np.floor(self.rng.random(k) * (2 * max_off + 1)).astype(np.int64) - max_off
+
+        x = center_x + off - w / 2
+        x = np.clip(x, self.edge_padding, self.screen_w - self.edge_padding - w)
+
+        sign = np.where(self.rng.random(k) < 0.5, -1.0, 1.0)
+
+        self.cur_x[idx] = x
+        self.cur_w[idx] = w
+        self.vx[idx] = sign * self.horizontal_speed
+        self.hold[idx] = 0
+
+    def _move(self, landed: np.ndarray) -> None:
+        """update_game 의 move 단계(경계 반사) — 이번 프레임에 착지하지 않은 런."""
+        a = self.alive & ~landed
+        x = self.cur_x + self.vx * self.dt
+        w = self.cur_w
+
+        center_x = self.top_x + self.top_w / 2
+        left = np.maximum(center_x - 500.0, self.edge_padding)
+        right = np.minimum(center_x + 500.0 - w, self.screen_w - self.edge_padding - w)
+
+        hit_l = x <= left
+        hit_r = (~hit_l) & (x >= right)
+        x = np.where(hit_l, left, np.where(hit_r, right, x))
+        flip = hit_l | hit_r
+
+        self.cur_x = np.where(a, x, self.cur_x)
+        self.vx = np.where(a & flip, -self.vx, self.vx)
+        self.hold += a
+
+    def _land(self, idx: np.ndarray) -> None:
+        """drop → 착지: compute_overlap + 실패/트림/PERFECT/콤보."""
+        if idx.size == 0:
+            return
+        cx, cw = self.cur_x[idx], self.cur_w[idx]
+        tx, tw = self.top_x[idx], self.top_w[idx]
+
+        left = np.maximum(cx, tx)
+        right = np.minimum(cx + cw, tx + tw)
+        overlap_w = np.maximum(0.0, right - left)
+        ratio = overlap_w / np.maximum(cw, 1.0)
+
+        fail = (ratio < self.min_overlap_ratio[idx]) | (overlap_w <= 0.0)
+        self.alive[idx[fail]] = False
+
+        ok = idx[~fail]
+        if ok.size == 0:
+            return
+        ok_ratio = ratio[~fail]
+
+        self.top_x[ok] = left[~fail]
+        self.top_w[ok] = overlap_w[~fail]
+        self.score[ok] += 1
+
+        perf = ok_ratio >= self.perfect_ratio[ok]
+        p_idx = ok[perf]
+        self.combo[p_idx] += 1
+        self.perfect[p_idx] += 1
+        self.max_combo[p_idx] = np.maximum(self.max_combo[p_idx], self.combo[p_idx])
+
+        reward = p_idx[self.combo[p_idx] % self.combo_every == 0]
+        self.width_bonus[reward] += self.combo_bonus[reward]
+
+        self.combo[ok[~perf]] = 0
+
+        self._spawn(ok)
+
+    _PER_RUN = (
+        "top_x", "top_w", "cur_x", "cur_w", "vx",
+        "score", "combo", "perfect", "max_combo", "width_bonus", "hold", "alive",
+        "min_overlap_ratio", "perfect_ratio", "combo_bonus", "ids",
+    )
+
+    def _flush(self, idx: np.ndarray) -> None:
+        ids = self.ids[idx]
+        self._out_score[ids] = self.score[idx]
+        self._out_perfect[ids] = self.perfect[idx]
+        self._out_max_combo[ids] = self.max_combo[idx]
+
+    def _compact(self) -> None:
+        """끝난 런을 배열에서 빼서 긴 꼬리 구간의 프레임 비용을 살아있는 런 수에 비례하게."""
+        keep = np.flatnonzero(self.alive)
+        self._flush(np.flatnonzero(~self.alive))
+        for name in self._PER_RUN:
+            setattr(self, name, getattr(self, name)[keep])
+        for k in list(self.aux):
+            self.aux[k] = self.aux[k][keep]
+        self.n = int(keep.size)
+
+    def step(self, drop: np.ndarray) -> None:
+        drop = drop & self.alive
+        drop |= self.alive & (self.hold >= self.max_hold_frames)
+        self._land(np.flatnonzero(drop))
+        self._move(drop)
+        self.frames += 1
+
+    def run(
+        self,
+        policy: Optional[BatchPolicy] = None,
+        max_blocks: Optional[int] = None,
+        max_frames: int = 1_000_000,
+    ) -> BatchResult:
+        policy = policy or aligned_policy()
+
+        while self.frames < max_frames:
+            if max_blocks is not None:
+                self.alive &= self.score < max_blocks
+            alive_n = int(np.count_nonzero(self.alive))
+            if alive_n == 0:
+                break
+            if alive_n * 2 < self.n:
+                self._compact()
+            self.step(np.asarray(policy(self), dtype=bool))
+
+        self._flush(np.arange(self.n))
+        return BatchResult(
+            score=self._out_score.copy(),
+            perfect=self._out_perfect.copy(),
+            max_combo=self._out_max_combo.copy(),
+            frames=self.frames,
+        )
+
+
+def sweep(
+    param: str,
+    values,
+    runs_per_value: int = 100_000,
+    policy_factory: Callable[[], BatchPolicy] = lambda: jitter_policy(12.0, seed=0),
+    seed: int = 0,
+    max_blocks: Optional[int] = 200,
+) -> Dict[float, Dict[str, float]]:
+    """param(min_overlap_ratio / perfect_ratio / combo_bonus) 값별 요약 통계."""
+    out: Dict[float, Dict[str, float]] = {}
+    for i, v in enumerate(values):
+        sim = BatchSimulator(runs_per_value, seed=seed + i, **{param: v})
+        out[float(v)] = sim.run(policy_factory(), max_blocks=max_blocks).summary()
+    return out
+
+
+def _main() -> None:
+    import argparse
+
+    ap = argparse.ArgumentParser(description="One More Block batch Monte-Carlo")
+    ap.add_argument("--param", default="min_overlap_ratio",
+                    choices=["min_overlap_ratio", "perfect_ratio", "combo_bonus"])
+    ap.add_argument("--values", default="")
+    ap.add_argument("--runs", type=int, default=100_000)
+    ap.add_argument("--sigma", type=float, default=12.0)
+    ap.add_argument("--max-blocks", type=int, default=200)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    defaults: Dict[str, Tuple[float, ...]] = {
+        "min_overlap_ratio": (0.10, 0.18, 0.25, 0.35),
+        "perfect_ratio": (0.90, 0.95, 0.98),
+        "combo_bonus": (0, 8, 16),
+    }
+    values = [float(v) for v in args.values.split(",") if v] or list(defaults[args.param])
+
+    res = sweep(
+        args.param,
+        values,
+        runs_per_value=args.runs,
+        policy_factory=lambda: jitter_policy(args.sigma, seed=args.seed),
+        seed=args.seed,
+        max_blocks=args.max_blocks,
+    )
+    for v, s in res.items():
+        cols = "  ".join(f"{k}={s[k]:.3f}" for k in s)
+        print(f"{args.param}={v:g}  {cols}")
+
+
+if __name__ == "__main__":
+    _main()
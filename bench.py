@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+"""bench.py
+
+헤드리스 벤치마크 (SDL dummy 드라이버, 창/소리 없음).
+- update_game: 스택 10 ~ 100k 에서 move 스텝 / 착지(drop→land) 한 사이클
+- draw_game: 900x600, 3840x2160 × 테마별
+- update_effects: 파티클 10 ~ 50k
+- build_bgm_loop / build_click_sfx 생성 시간
+- save_data 함수별 + SaveStore flush (SAVE_PATH 는 임시 파일로 돌림)
+
+결과는 JSON (케이스마다 반복 샘플 = 호출 1회당 초).
+기준선 저장/회귀 비교는 bench_baseline.py.
+
+python bench.py run --out bench.json
+python bench.py run --quick --only update_game,effects
+python bench.py save main
+python bench.py compare main --threshold 0.10   # 회귀면 exit 1
+"""
+
+import os
+
+# pygame import 전에 지정해야 먹힘
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # stdout 은 JSON 전용
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+import config
+import save_data
+from audio import build_bgm_loop
+from audio_sfx import build_click_bank, build_click_sfx
+from bench_baseline import (
+    compare_reports,
+    diffs_to_json,
+    env_mismatch,
+    format_report,
+    has_regression,
+    list_baselines,
+    load_baseline,
+    save_baseline,
+)
+from camera import compute_target_cam_y
+from effects import (
+    PARTICLE_SIZE,
+    PARTICLE_SPEED_X,
+    PARTICLE_SPEED_Y,
+    PARTICLE_SPREAD,
+    update_effects,
+)
+from mechanics import begin_drop, get_top_block, top_surface_y
+from models import Block, GameState
+from particles import ParticlePool
+from render import draw_game, invalidate_caches
+from spawner import reset_run, spawn_next_block
+from themes import THEME_ORDER
+from update import update_game
+from utils import pastel_color
+
+Result = Dict[str, Any]
+
+STACK_SIZES: Tuple[int, ...] = (10, 100, 1_000, 10_000, 100_000)
+PARTICLE_COUNTS: Tuple[int, ...] = (10, 100, 1_000, 10_000, 50_000)
+RESOLUTIONS: Tuple[Tuple[int, int], ...] = ((900, 600), (3840, 2160))
+DRAW_STACK = 200
+
+GROUPS: Tuple[str, ...] = ("update_game", "draw_game", "effects", "audio", "save")
+
+
+def _measure(fn: Callable[[], Any], repeat: int, number: int) -> List[float]:
+    """fn 을 number 번 도는 걸 repeat 번 → 호출 1회당 초 리스트."""
+    fn()  # 워밍업 (캐시/지연 import)
+    samples: List[float] = []
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        for _ in range(max(1, number)):
+            fn()
+        samples.append((time.perf_counter() - t0) / max(1, number))
+    return samples
+
+
+def _result(group: str, name: str, params: Dict[str, Any], samples: List[float], number: int) -> Result:
+    return {
+        "group": group,
+        "name": name,
+        "params": params,
+        "unit": "s",
+        "number": number,
+        "samples": samples,
+        "mean": statistics.fmean(samples),
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def _update_kwargs(W: int, floor_y: float) -> Dict[str, Any]:
+    return dict(
+        screen_w=W,
+        floor_y=floor_y,
+        hover_y=config.HOVER_Y,
+        block_h=config.BLOCK_H,
+        fall_speed=config.FALL_SPEED,
+        horizontal_speed=config.HORIZONTAL_SPEED,
+        edge_padding=config.EDGE_PADDING,
+        min_overlap_ratio=config.MIN_OVERLAP_RATIO,
+        perfect_ratio=config.PERFECT_RATIO,
+        flash_time=config.FLASH_TIME,
+        combo_every=config.COMBO_REWARD_EVERY,
+        combo_bonus=config.COMBO_WIDTH_BONUS,
+        shard_gravity=config.SHARD_GRAVITY,
+        shard_fall_speed=config.SHARD_FALL_SPEED,
+    )
+
+
+def build_stack_state(n_blocks: int, screen_size: Tuple[int, int], seed: int = 0) -> GameState:
+    """블록 n_blocks 개가 쌓인 상태 (바닥 블록 포함) + move 중인 현재 블록."""
+    random.seed(seed)
+    W, H = screen_size
+    floor_y = H - config.FLOOR_MARGIN
+
+    state = GameState()
+    reset_run(
+        state,
+        screen_w=W,
+        floor_y=floor_y,
+        hover_y=config.HOVER_Y,
+        block_h=config.BLOCK_H,
+        edge_padding=config.EDGE_PADDING,
+        horizontal_speed=config.HORIZONTAL_SPEED,
+    )
+    base = get_top_block(state)
+    for i in range(1, n_blocks):
+        w = base.w - (i % 7) * 2
+        state.push_block(Block(
+            x=base.x + (i % 5) * 3,
+            y=base.y - i * config.BLOCK_H,
+            w=w,
+            h=config.BLOCK_H,
+            color=pastel_color(),
+            phase="settled",
+        ))
+    state.score = n_blocks - 1
+    spawn_next_block(
+        state, W, config.HOVER_Y, config.BLOCK_H, config.EDGE_PADDING, config.HORIZONTAL_SPEED
+    )
+    return state
+
+
+def bench_update_game(repeat: int, stack_sizes: Sequence[int]) -> List[Result]:
+    size = (config.WINDOW_W, config.WINDOW_H)
+    floor_y = size[1] - config.FLOOR_MARGIN
+    kw = _update_kwargs(size[0], floor_y)
+    dt = 1.0 / config.SIM_HZ
+    out: List[Result] = []
+
+    for n in stack_sizes:
+        state = build_stack_state(n, size)
+
+        def _move() -> None:
+            update_game(state, dt=dt, **kw)
+
+        number = 2000
+        out.append(_result("update_game", f"update_game/move/stack={n}", {"stack": n}, _measure(_move, repeat, number), number))
+
+        # 착지할 때마다 블록이 쌓이므로 매번 되돌려서 항상 stack=n 에서 잼
+        top = get_top_block(state)
+        snap_cur = replace(state.current, x=top.x, w=top.w)
+        snap = (state.score, state.perfect_combo, state.width_bonus, state.run_total_perfect, state.run_max_combo)
+
+        def _land() -> None:
+            # top 중앙에 맞춰 드랍 → PERFECT 착지 + 다음 블록 스폰까지
+            state.current = cur = replace(snap_cur)
+            begin_drop(state)
+            land_dt = max(dt, (top_surface_y(state, floor_y) - cur.h - cur.y) / config.FALL_SPEED)
+            update_game(state, dt=land_dt, **kw)
+            update_game(state, dt=dt, **kw)
+
+            state.pop_block()
+            state.particles.clear()
+            (state.score, state.perfect_combo, state.width_bonus,
+             state.run_total_perfect, state.run_max_combo) = snap
+
+        number = 200
+        out.append(_result("update_game", f"update_game/land/stack={n}", {"stack": n}, _measure(_land, repeat, number), number))
+    return out
+
+
+def bench_draw_game(repeat: int, resolutions: Sequence[Tuple[int, int]]) -> List[Result]:
+    font_main = pygame.font.SysFont("consolas", 24)
+    font_hint = pygame.font.SysFont("consolas", 18)
+    font_flash = pygame.font.SysFont("consolas", 30)
+    out: List[Result] = []
+
+    for W, H in resolutions:
+        screen = pygame.display.set_mode((W, H))
+        invalidate_caches()
+        floor_y = H - config.FLOOR_MARGIN
+        state = build_stack_state(DRAW_STACK, (W, H))
+        cam_y = compute_target_cam_y(state, config.CAMERA_TOP_MARGIN)
+
+        for key in THEME_ORDER:
+            state.selected_theme = key
+
+            def _draw() -> None:
+                draw_game(
+                    screen,
+                    font_main=font_main,
+                    font_hint=font_hint,
+                    font_flash=font_flash,
+                    state=state,
+                    cam_y=cam_y,
+                    screen_size=(W, H),
+                    floor_y=floor_y,
+                    theme_key=key,
+                )
+
+            number = 20 if W * H > 2_000_000 else 100
+            out.append(_result(
+                "draw_game",
+                f"draw_game/{W}x{H}/{key}",
+                {"w": W, "h": H, "theme": key, "stack": DRAW_STACK},
+                _measure(_draw, repeat, number),
+                number,
+            ))
+    return out
+
+
+def bench_effects(repeat: int, counts: Sequence[int]) -> List[Result]:
+    dt = 1.0 / config.SIM_HZ
+    out: List[Result] = []
+
+    for n in counts:
+        state = GameState()
+        state.particles = ParticlePool(capacity=max(n, 1), rng=random.Random(0))
+        # 수명을 길게 잡아 측정 중에 개수가 줄지 않게
+        state.particles.emit_burst(
+            n, 450.0, 300.0, (200, 180, 240),
+            spread=PARTICLE_SPREAD,
+            speed_x=PARTICLE_SPEED_X,
+            speed_y=PARTICLE_SPEED_Y,
+            size=PARTICLE_SIZE,
+            life=(1e9, 1e9),
+        )
+
+        def _step() -> None:
+            update_effects(state, dt)
+
+        number = 200 if n <= 10_000 else 50
+        out.append(_result("effects", f"update_effects/particles={n}", {"particles": n}, _measure(_step, repeat, number), number))
+    return out
+
+
+def bench_audio(repeat: int) -> List[Result]:
+    return [
+        _result("audio", "build_bgm_loop", {}, _measure(build_bgm_loop, repeat, 1), 1),
+        _result("audio", "build_click_sfx", {}, _measure(build_click_sfx, repeat, 20), 20),
+        _result("audio", "build_click_bank", {}, _measure(build_click_bank, repeat, 20), 20),
+    ]
+
+
+def bench_save(repeat: int) -> List[Result]:
+    record = {
+        "time": "2024-01-01 00:00",
+        "score": 42,
+        "perfect": 7,
+        "max_combo": 3,
+        "skin": "sky",
+    }
+    calls: List[Tuple[str, Callable[[], Any]]] = [
+        ("load_best", lambda: save_data.load_best(0)),
+        ("save_best", lambda: save_data.save_best(123)),
+        ("load_bgm_settings", lambda: save_data.load_bgm_settings(True, 0.25)),
+        ("save_bgm_settings", lambda: save_data.save_bgm_settings(True, 0.25)),
+        ("load_theme_settings", lambda: save_data.load_theme_settings("sky")),
+        ("save_theme_settings", lambda: save_data.save_theme_settings("neon", ["sky", "neon"])),
+        ("load_lifetime_perfect", lambda: save_data.load_lifetime_perfect(0)),
+        ("save_lifetime_perfect", lambda: save_data.save_lifetime_perfect(77)),
+        ("load_runs", save_data.load_runs),
+        ("append_run", lambda: save_data.append_run(record, limit=30)),
+    ]
+
+    tick = [0]
+
+    def _flush() -> None:
+        # 변경 1건 + 디스크 기록 (워커가 하는 일을 동기로)
+        tick[0] += 1
+        save_data.save_lifetime_perfect(tick[0])
+        save_data.get_store().flush()
+
+    calls.append(("flush", _flush))
+
+    out: List[Result] = []
+    orig = save_data.SAVE_PATH
+    with tempfile.TemporaryDirectory() as tmp:
+        save_data.SAVE_PATH = Path(tmp) / "save_data.json"
+        try:
+            # 실제 게임처럼 runs 30개가 찬 파일 기준
+            for _ in range(30):
+                save_data.append_run(record, limit=30)
+            for name, fn in calls:
+                number = 50
+                out.append(_result("save", f"save_data/{name}", {}, _measure(fn, repeat, number), number))
+        finally:
+            save_data.close_store()
+            save_data.SAVE_PATH = orig
+    return out
+
+
+def _env_info() -> Dict[str, Any]:
+    try:
+        import numpy as np
+        numpy_ver: Optional[str] = np.__version__
+    except ImportError:
+        numpy_ver = None
+    return {
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "pygame": pygame.version.ver,
+        "numpy": numpy_ver,
+    }
+
+
+def run_benchmarks(groups: Sequence[str] = GROUPS, repeat: int = 5, quick: bool = False) -> Dict[str, Any]:
+    pygame.display.init()
+    pygame.font.init()
+    try:
+        results: List[Result] = []
+        for g in groups:
+            t0 = time.perf_counter()
+            if g == "update_game":
+                results += bench_update_game(repeat, STACK_SIZES[:3] if quick else STACK_SIZES)
+            elif g == "draw_game":
+                results += bench_draw_game(repeat, RESOLUTIONS[:1] if quick else RESOLUTIONS)
+            elif g == "effects":
+                results += bench_effects(repeat, PARTICLE_COUNTS[:3] if quick else PARTICLE_COUNTS)
+            elif g == "audio":
+                results += bench_audio(repeat)
+            elif g == "save":
+                results += bench_save(repeat)
+            else:
+                raise ValueError(f"unknown group: {g} (choose from {', '.join(GROUPS)})")
+            print(f"[bench] {g}: {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+    finally:
+        pygame.quit()
+
+    return {"env": _env_info(), "repeat": repeat, "quick": quick, "results": results}
+
+
+def _add_run_args(ap: argparse.ArgumentParser) -> None:
+    ap.add_argument("--only", default="", help="comma separated: " + ", ".join(GROUPS))
+    ap.add_argument("--repeat", type=int, default=5, help="samples per case")
+    ap.add_argument("--quick", action="store_true", help="smaller sizes, for a fast sanity run")
+    ap.add_argument("--from", dest="from_file", default="", help="use an existing report JSON instead of running")
+
+
+def _report_from_args(args: argparse.Namespace) -> Dict[str, Any]:
+    if args.from_file:
+        return json.loads(Path(args.from_file).read_text(encoding="utf-8"))
+    groups = [g.strip() for g in args.only.split(",") if g.strip()] or list(GROUPS)
+    return run_benchmarks(groups, repeat=args.repeat, quick=args.quick)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="One More Block headless benchmarks")
+    sub = ap.add_subparsers(dest="cmd")
+
+    p_run = sub.add_parser("run", help="run and print/write the JSON report")
+    _add_run_args(p_run)
+    p_run.add_argument("--out", default="", help="write JSON here (default: stdout)")
+
+    p_save = sub.add_parser("save", help="run and store as a named baseline")
+    p_save.add_argument("name")
+    _add_run_args(p_save)
+
+    p_cmp = sub.add_parser("compare", help="run and compare against a baseline (exit 1 on regression)")
+    p_cmp.add_argument("name")
+    _add_run_args(p_cmp)
+    p_cmp.add_argument("--threshold", type=float, default=0.10, help="slowdown ratio that counts as regression")
+    p_cmp.add_argument("--confidence", type=float, default=0.95)
+    p_cmp.add_argument("--out", default="", help="write comparison JSON here")
+
+    sub.add_parser("list", help="list stored baselines")
+
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0].startswith("-") and argv[0] not in ("-h", "--help"):
+        argv.insert(0, "run")  # 예전 사용법(python bench.py --out x.json) 유지
+    args = ap.parse_args(argv)
+
+    if args.cmd == "list":
+        for name in list_baselines():
+            print(name)
+        return 0
+
+    try:
+        if args.cmd == "compare":
+            base = load_baseline(args.name)  # 오래 돌리기 전에 먼저 확인
+        report = _report_from_args(args)
+
+        if args.cmd == "run":
+            text = json.dumps(report, indent=2)
+            if args.out:
+                Path(args.out).write_text(text, encoding="utf-8")
+            else:
+                print(text)
+            return 0
+
+        if args.cmd == "save":
+            print(f"saved {save_baseline(args.name, report)}")
+            return 0
+
+        diffs = compare_reports(base, report, threshold=args.threshold, confidence=args.confidence)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    print(format_report(diffs, args.threshold, args.confidence, env_mismatch(base, report)))
+    if args.out:
+        Path(args.out).write_text(
+            json.dumps({"baseline": args.name, "threshold": args.threshold, "cases": diffs_to_json(diffs)}, indent=2),
+            encoding="utf-8",
+        )
+    return 1 if has_regression(diffs) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+"""bench_baseline.py
+
+bench.py 결과 기준선(baseline) 저장 + 회귀 비교.
+- 기준선: bench_baselines/<name>.json (bench.py 리포트 그대로 + 이름)
+- 케이스별 반복 샘플로 평균의 신뢰구간(t 분포) 계산
+- 차이는 Welch t 검정 기준으로 유의할 때만 판정 → 노이즈로 인한 오탐 줄임
+- 느려진 비율이 threshold 를 넘고 유의하면 regression
+"""
+
+import json
+import math
+import re
+import statistics
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+BASELINE_DIR = Path("bench_baselines")
+
+# 회귀 시 빌드를 막는 그룹 (effects 는 참고용으로만 표시)
+GATED_GROUPS: Tuple[str, ...] = ("update_game", "draw_game", "audio", "save")
+
+_NAME_RE = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+def t_quantile(p: float, df: float) -> float:
+    """Student t 분포 분위수 (scipy 없이 근사)."""
+    if df <= 0:
+        raise ValueError("df must be > 0")
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2.0 * p - 1.0) / math.sqrt(2.0 * p * (1.0 - p))
+
+    # Cornish-Fisher 전개 (df >= 3 에서 1e-3 수준 오차)
+    z = statistics.NormalDist().inv_cdf(p)
+    z2 = z * z
+    g1 = (z2 + 1.0) * z / 4.0
+    g2 = ((5.0 * z2 + 16.0) * z2 + 3.0) * z / 96.0
+    g3 = (((3.0 * z2 + 19.0) * z2 + 17.0) * z2 - 15.0) * z / 384.0
+    g4 = ((((79.0 * z2 + 776.0) * z2 + 1482.0) * z2 - 1920.0) * z2 - 945.0) * z / 92160.0
+    return z + g1 / df + g2 / df ** 2 + g3 / df ** 3 + g4 / df ** 4
+
+
+def mean_ci(samples: Sequence[float], confidence: float = 0.95) -> Tuple[float, float, float]:
+    """(mean, lo, hi)"""
+    n = len(samples)
+    m = statistics.fmean(samples)
+    if n < 2:
+        return m, m, m
+    half = t_quantile(0.5 + confidence / 2.0, n - 1) * statistics.stdev(samples) / math.sqrt(n)
+    return m, m - half, m + half
+
+
+def welch_diff_ci(a: Sequence[float], b: Sequence[float], confidence: float = 0.95) -> Tuple[float, float, float]:
+    """mean(b) - mean(a) 의 Welch 신뢰구간 (diff, lo, hi)."""
+    ma, mb = statistics.fmean(a), statistics.fmean(b)
+    diff = mb - ma
+    if len(a) < 2 or len(b) < 2:
+        return diff, diff, diff
+
+    va = statistics.variance(a) / len(a)
+    vb = statistics.variance(b) / len(b)
+    se2 = va + vb
+    if se2 <= 0.0:
+        return diff, diff, diff
+    df = se2 * se2 / (va * va / (len(a) - 1) + vb * vb / (len(b) - 1))
+    half = t_quantile(0.5 + confidence / 2.0, df) * math.sqrt(se2)
+    return diff, diff - half, diff + half
+
+
+@dataclass
+class CaseDiff:
+    name: str
+    group: str
+    base_mean: float
+    new_mean: float
+    change: float        # new/base - 1
+    change_lo: float     # 차이 신뢰구간을 base 대비 비율로
+    change_hi: float
+    status: str          # regression | improvement | noise | ok | new | missing
+    gated: bool
+
+
+def compare_reports(
+    base: Dict[str, Any],
+    new: Dict[str, Any],
+    threshold: float = 0.10,
+    confidence: float = 0.95,
+    gated_groups: Sequence[str] = GATED_GROUPS,
+) -> List[CaseDiff]:
+    base_by = {r["name"]: r for r in base.get("results", [])}
+    new_by = {r["name"]: r for r in new.get("results", [])}
+    out: List[CaseDiff] = []
+
+    for name, nr in new_by.items():
+        group = nr.get("group", "")
+        gated = group in gated_groups
+        br = base_by.get(name)
+        if br is None:
+            m = statistics.fmean(nr["samples"])
+            out.append(CaseDiff(name, group, math.nan, m, math.nan, math.nan, math.nan, "new", gated))
+            continue
+
+        a, b = br["samples"], nr["samples"]
+        bm = statistics.fmean(a)
+        diff, lo, hi = welch_diff_ci(a, b, confidence)
+        scale = bm if bm > 0.0 else 1.0
+        change, change_lo, change_hi = diff / scale, lo / scale, hi / scale
+
+        if abs(change) <= threshold:
+            status = "ok"
+        elif change > 0.0:
+            # 구간 전체가 0 위 → 유의하게 느려짐
+            status = "regression" if change_lo > 0.0 else "noise"
+        else:
+            status = "improvement" if change_hi < 0.0 else "noise"
+
+        out.append(CaseDiff(name, group, bm, bm + diff, change, change_lo, change_hi, status, gated))
+
+    for name, br in base_by.items():
+        if name not in new_by:
+            bm = statistics.fmean(br["samples"])
+            out.append(CaseDiff(name, br.get("group", ""), bm, math.nan, math.nan, math.nan, math.nan, "missing", False))
+    return out
+
+
+def has_regression(diffs: Sequence[CaseDiff]) -> bool:
+    return any(d.status == "regression" and d.gated for d in diffs)
+
+
+def env_mismatch(base: Dict[str, Any], new: Dict[str, Any]) -> List[str]:
+    """비교 결과를 믿기 어려운 환경 차이 목록."""
+    be, ne = base.get("env", {}), new.get("env", {})
+    keys = ("python", "implementation", "machine", "pygame", "numpy", "cpu_count")
+    out = [f"{k}: {be.get(k)} -> {ne.get(k)}" for k in keys if be.get(k) != ne.get(k)]
+    if base.get("quick") != new.get("quick"):
+        out.append(f"quick: {base.get('quick')} -> {new.get('quick')}")
+    return out
+
+
+def baseline_path(name: str, root: Path = BASELINE_DIR) -> Path:
+    if not _NAME_RE.match(name):
+        raise ValueError(f"bad baseline name: {name!r} (use letters, digits, _ . -)")
+    return root / f"{name}.json"
+
+
+def save_baseline(name: str, report: Dict[str, Any], root: Path = BASELINE_DIR) -> Path:
+    path = baseline_path(name, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = dict(report)
+    data["baseline"] = {"name": name, "saved": datetime.now().isoformat(timespec="seconds")}
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    tmp.replace(path)
+    return path
+
+
+def load_baseline(name: str, root: Path = BASELINE_DIR) -> Dict[str, Any]:
+    path = baseline_path(name, root)
+    if not path.exists():
+        raise ValueError(f"no baseline named {name!r} in {root}")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def list_baselines(root: Path = BASELINE_DIR) -> List[str]:
+    if not root.exists():
+        return []
+    return sorted(p.stem for p in root.glob("*.json"))
+
+
+def _fmt_time(s: float) -> str:
+    if math.isnan(s):
+        return "-"
+    if s >= 1.0:
+        return f"{s:.3f}s"
+    if s >= 1e-3:
+        return f"{s * 1e3:.3f}ms"
+    return f"{s * 1e6:.1f}us"
+
+
+def _fmt_pct(v: float) -> str:
+    return "-" if math.isnan(v) else f"{v * 100:+.1f}%"
+
+
+def format_report(diffs: Sequence[CaseDiff], threshold: float, confidence: float, warnings: Optional[Sequence[str]] = None) -> str:
+    lines: List[str] = []
+    for w in warnings or ():
+        lines.append(f"warning: env differs ({w})")
+
+    lines.append(
+        f"{'case':<40} {'base':>10} {'new':>10} {'change':>8}  {f'{confidence:.0%} CI':>17}  status"
+    )
+    for d in sorted(diffs, key=lambda d: d.name):
+        ci = "-" if math.isnan(d.change_lo) else f"[{_fmt_pct(d.change_lo)}, {_fmt_pct(d.change_hi)}]"
+        status = d.status.upper() if d.status == "regression" and d.gated else d.status
+        if d.status == "regression" and not d.gated:
+            status += " (not gated)"
+        lines.append(
+            f"{d.name:<40} {_fmt_time(d.base_mean):>10} {_fmt_time(d.new_mean):>10} "
+            f"{_fmt_pct(d.change):>8}  {ci:>17}  {status}"
+        )
+
+    n_reg = sum(1 for d in diffs if d.status == "regression" and d.gated)
+    lines.append(f"{n_reg} regression(s) over {threshold:.0%} in {', '.join(GATED_GROUPS)}")
+    return "\n".join(lines)
+
+
+def diffs_to_json(diffs: Sequence[CaseDiff]) -> List[Dict[str, Any]]:
+    # NaN 은 JSON 표준이 아니라 None 으로
+    return [
+        {k: (None if isinstance(v, float) and math.isnan(v) else v) for k, v in asdict(d).items()}
+        for d in diffs
+    ]
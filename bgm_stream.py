@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+"""bgm_stream.py
+
+스트리밍 BGM 시퀀서 (config.BGM_STREAMING).
+- 루프 전체를 미리 만들지 않고 아르페지오 한 스텝(기본 0.25초)씩 재생 직전에 합성
+- 합성은 AudioLoader 워커에서 (프레임 스레드는 Sound 로 감싸서 queue 만), 로더가 없으면 그 자리에서
+- 채널 0 에 Channel.queue 로 이어 붙임, 미리 만든 청크는 lookahead 개만 보관 → 메모리 일정
+- 점수가 오르면 템포도 올라감 (스텝이 짧아짐), 템포는 구간으로 나눠 청크 LRU 캐시 재사용
+- 재생 중인데 채널이 비면 underrun 으로 한 번 세고, 다음 청크가 오는 대로 다시 시작
+"""
+
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Deque, List, Optional, Set, Tuple
+
+import pygame
+
+import config
+from audio import BGM_FADE_SEC, BGM_GAIN, BGM_STEP_SEC, _clamp, bgm_steps, init_bgm_channel
+from audio_loader import AudioLoader
+from synth import tone
+
+SR = 44100
+TEMPO_QUANT = 0.05  # 템포 구간 (청크 캐시 키)
+CHUNK_CACHE = 96
+
+ChunkKey = Tuple[int, float]
+
+
+def tempo_for_score(score: int) -> float:
+    t = 1.0 + max(0, score) * config.BGM_TEMPO_PER_SCORE
+    t = min(t, config.BGM_TEMPO_MAX)
+    return round(round(t / TEMPO_QUANT) * TEMPO_QUANT, 3)
+
+
+@dataclass
+class BgmSequencer:
+    enabled: bool = False
+    on: bool = True
+    volume: float = 0.25
+    lookahead: int = 2
+
+    tempo: float = 1.0
+    underruns: int = 0
+    chunks_played: int = 0
+    # 청크 합성을 맡길 로더 (None 이면 update 안에서 바로 합성)
+    loader: Optional[AudioLoader] = None
+
+    _channel: Optional[pygame.mixer.Channel] = None
+    _steps: List[List[float]] = field(default_factory=list)
+    _step: int = 0
+    _ready: Deque[pygame.mixer.Sound] = field(default_factory=deque)
+    _cache: "OrderedDict[ChunkKey, pygame.mixer.Sound]" = field(default_factory=OrderedDict)
+    _requested: Set[ChunkKey] = field(default_factory=set)
+    _playing: bool = False
+    _starved: bool = False
+
+    def __post_init__(self) -> None:
+        # 0 이하면 채울 게 없어 재생이 영영 시작 안 됨
+        self.lookahead = max(1, int(self.lookahead))
+
+    def init(self, build: bool = True) -> None:
+        """build 는 BgmPlayer 와 인터페이스 맞춤용 (미리 만들 버퍼가 없음)."""
+        self._channel = init_bgm_channel()
+        if self._channel is None:
+            self.enabled = False
+            return
+        self.enabled = True
+        self._steps = bgm_steps()
+        self.apply()
+
+    def _pcm(self, key: ChunkKey) -> bytes:
+        """워커 스레드에서도 호출 (pygame 호출 없음)."""
+        i, tempo = key
+        n = max(1, int(SR * BGM_STEP_SEC / tempo))
+        return tone(self._steps[i], n=n, sr=SR, gain=BGM_GAIN, fade_n=int(SR * BGM_FADE_SEC)).tobytes()
+
+    def _store(self, key: ChunkKey, data: Optional[bytes]) -> None:
+        """메인 스레드: 합성된 PCM 을 Sound 로 감싸 캐시에."""
+        self._requested.discard(key)
+        if data is None:
+            return
+        self._cache[key] = pygame.mixer.Sound(buffer=data)
+        if len(self._cache) > CHUNK_CACHE:
+            self._cache.popitem(last=False)
+
+    def _chunk(self, key: ChunkKey) -> Optional[pygame.mixer.Sound]:
+        """캐시에 있으면 Sound, 없으면 합성 요청하고 None (로더 없으면 바로 합성)."""
+        snd = self._cache.get(key)
+        if snd is not None:
+            self._cache.move_to_end(key)
+            return snd
+        if self.loader is None:
+            self._store(key, self._pcm(key))
+            return self._cache.get(key)
+        if key not in self._requested:
+            self._requested.add(key)
+            self.loader.submit(lambda key=key: self._pcm(key), lambda data, key=key: self._store(key, data))
+        return None
+
+    def _fill(self) -> None:
+        while len(self._ready) < self.lookahead:
+            snd = self._chunk((self._step, self.tempo))
+            if snd is None:
+                return  # 워커가 만들 때까지 대기
+            self._ready.append(snd)
+            self._step = (self._step + 1) % len(self._steps)
+
+    def update(self, score: int) -> None:
+        """메인 루프에서 매 프레임 (AudioLoader.poll 다음)."""
+        if not self.enabled or not self.on or self._channel is None:
+            return
+        self.tempo = tempo_for_score(score)
+        self._fill()
+
+        ch = self._channel
+        try:
+            if not ch.get_busy():
+                if not self._ready:
+                    if self._playing and not self._starved:
+                        self.underruns += 1
+                        self._starved = True
+                    return
+                ch.play(self._ready.popleft())
+                self.chunks_played += 1
+                self._playing = True
+                self._starved = False
+
+            if ch.get_queue() is None and self._ready:
+                ch.queue(self._ready.popleft())
+                self.chunks_played += 1
+        except pygame.error:
+            return
+
+        self._fill()
+
+    def apply(self) -> None:
+        if not self.enabled or self._channel is None:
+            return
+
+        v = _clamp(self.volume, 0.0, 1.0) if self.on else 0.0
+        try:
+            self._channel.set_volume(v)
+        except Exception:
+            pass
+
+        if not self.on:
+            try:
+                self._channel.stop()
+            except Exception:
+                pass
+            self._playing = False
+            self._starved = False
+            self._ready.clear()
+
+    def set_volume(self, v: float) -> None:
+        self.volume = _clamp(float(v), 0.0, 1.0)
+        self.apply()
+
+    def stop(self) -> None:
+        self.on = False
+        self.apply()
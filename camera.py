@@ -8,10 +8,10 @@ from models import GameState
 
 
 def compute_target_cam_y(state: GameState, camera_top_margin: int) -> float:
-    if not state.stack:
+    if not state.stack_index:
         return 0.0
 
-    top_y = min(b.y for b in state.stack)
+    top_y = state.stack_index.top_y(0.0)
     if top_y >= camera_top_margin:
         return 0.0
 
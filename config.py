@@ -8,6 +8,14 @@ One More Block - 전역 설정 파일
 # =========================
 FPS = 60
 
+# 고정 스텝 시뮬레이션 (렌더는 마지막 두 스텝 사이 보간)
+FIXED_TIMESTEP = True
+SIM_HZ = 120
+MAX_SIM_STEPS_PER_FRAME = 8
+
+# 프레임 시간이 예산(1/FPS)을 넘으면 효과 품질을 단계적으로 낮춤
+QUALITY_GOVERNOR = True
+
 WINDOW_W, WINDOW_H = 900, 600
 
 WINDOW_MODE_WINDOWED = "windowed"
@@ -17,6 +25,9 @@ WINDOW_MODE_BORDERLESS = "borderless"
 # 요청: 풀스크린 X, 창모드 전체크기 기본
 START_WINDOW_MODE = WINDOW_MODE_WINDOWED_MAX
 
+# 바뀐 영역만 다시 그리고 display.update(rects) 로 표시 (카메라 이동 시 전체)
+DIRTY_RECT_PRESENT = False
+
 # pygame key name (안전)
 KEY_TOGGLE_WINDOW_MODE = "f11"
 KEY_QUIT = "escape"
@@ -55,9 +66,31 @@ FLASH_TIME = 0.45
 SHARD_GRAVITY = 1800
 SHARD_FALL_SPEED = 200
 
+# =========================
+# STARTUP (startup.py)
+# =========================
+FONT_NAME = "consolas"
+FONT_CACHE_PATH = "font_cache.json"
+# 단계별 시작 시간 기록 파일 ("" 이면 안 씀), STARTUP_REPORT 면 stderr 에도 출력
+STARTUP_TIMELINE_PATH = "startup_timeline.json"
+STARTUP_REPORT = False
+
 # =========================
 # BGM
 # =========================
 BGM_DEFAULT_ON = True
 BGM_DEFAULT_VOLUME = 0.25
 BGM_VOLUME_STEP = 0.05
+
+# 스트리밍 시퀀서 (bgm_stream.py): 스텝 단위 합성 + Channel.queue, 점수 따라 템포 상승
+BGM_STREAMING = True
+BGM_TEMPO_PER_SCORE = 0.005
+BGM_TEMPO_MAX = 1.5
+
+# BGM/SFX 버퍼를 워커 스레드에서 생성 (첫 프레임이 오디오 합성을 안 기다림)
+AUDIO_BACKGROUND_BUILD = True
+
+# 생성한 BGM/SFX PCM 디스크 캐시 (audio_cache.py)
+AUDIO_CACHE = True
+AUDIO_CACHE_DIR = "audio_cache"
+AUDIO_CACHE_MAX_BYTES = 16 * 1024 * 1024
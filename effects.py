@@ -6,9 +6,10 @@ from __future__ import annotations
 - PERFECT 순간 카메라 흔들림 + 파티클
 """
 
-import random
 from typing import Tuple
-from models import GameState, Particle
+from models import GameState
+from particles import FX_RNG
+from quality import get_quality
 
 SHAKE_DURATION = 0.12
 SHAKE_STRENGTH = 10.0
@@ -18,47 +19,49 @@ PARTICLE_LIFE = (0.18, 0.35)
 PARTICLE_SIZE = (3, 6)
 PARTICLE_SPEED_X = (-180, 180)
 PARTICLE_SPEED_Y = (-420, -160)
+PARTICLE_SPREAD = (18, 8)
 PARTICLE_GRAVITY = 1100.0
 
 
 def trigger_perfect(state: GameState, x: float, y: float, color: Tuple[int, int, int]) -> None:
+    q = get_quality(state.quality_level)
+
     state.shake_timer = SHAKE_DURATION
     state.shake_duration = SHAKE_DURATION
-    state.shake_strength = SHAKE_STRENGTH
-
-    n = random.randint(PARTICLE_COUNT[0], PARTICLE_COUNT[1])
-    for _ in range(n):
-        size = random.randint(PARTICLE_SIZE[0], PARTICLE_SIZE[1])
-        life = random.uniform(PARTICLE_LIFE[0], PARTICLE_LIFE[1])
-
-        vx = random.uniform(PARTICLE_SPEED_X[0], PARTICLE_SPEED_X[1])
-        vy = random.uniform(PARTICLE_SPEED_Y[0], PARTICLE_SPEED_Y[1])
-
-        px = x + random.uniform(-18, 18)
-        py = y + random.uniform(-8, 8)
-
-        state.particles.append(
-            Particle(x=px, y=py, vx=vx, vy=vy, size=size, color=color, life=life, age=0.0)
-        )
+    state.shake_strength = SHAKE_STRENGTH * q.shake_scale
+
+    # 연출 난수는 FX_RNG (품질 단계와 무관하게 게임 random 흐름 유지)
+    n = FX_RNG.randint(PARTICLE_COUNT[0], PARTICLE_COUNT[1])
+    n = int(round(n * q.particle_scale))
+    state.particles.emit_burst(
+        n,
+        x,
+        y,
+        color,
+        spread=PARTICLE_SPREAD,
+        speed_x=PARTICLE_SPEED_X,
+        speed_y=PARTICLE_SPEED_Y,
+        size=PARTICLE_SIZE,
+        life=PARTICLE_LIFE,
+    )
 
 
 def update_effects(state: GameState, dt: float) -> float:
-    # 파티클 업데이트
-    for p in state.particles[:]:
-        p.age += dt
-        if p.age >= p.life:
-            state.particles.remove(p)
-            continue
-
-        p.vy += PARTICLE_GRAVITY * dt
-        p.x += p.vx * dt
-        p.y += p.vy * dt
+    # 파티클 업데이트 (풀 전체 한 번에 적분 + 만료 압축)
+    state.particles.update(dt, PARTICLE_GRAVITY)
 
     # 쉐이크 오프셋 반환
     if state.shake_timer > 0.0:
         state.shake_timer = max(0.0, state.shake_timer - dt)
         t = state.shake_timer / max(0.0001, state.shake_duration)
         amp = state.shake_strength * t
-        return random.uniform(-amp, amp)
+        return FX_RNG.uniform(-amp, amp)
 
     return 0.0
+
+
+def update_flash(state: GameState, dt: float) -> None:
+    if state.flash_timer > 0.0:
+        state.flash_timer = max(0.0, state.flash_timer - dt)
+        if state.flash_timer == 0.0:
+            state.flash_text = ""
@@ -5,23 +5,15 @@ from __future__ import annotations
 - 드랍: 클릭/스페이스
 - 게임오버: 스페이스/엔터로 재시작
 - 게임오버: 좌/우로 테마 변경 시도
+- F3: 프레임 프로파일러 오버레이
 """
 
 from typing import Optional
 import pygame
+from mechanics import begin_drop
 from models import GameState
 
 
-def _begin_drop(state: GameState) -> None:
-    if not state.current:
-        return
-    if state.current.phase != "move":
-        return
-    state.current._orig_x = state.current.x
-    state.current._orig_w = state.current.w
-    state.current.phase = "drop"
-
-
 def handle_events(state: GameState, key_toggle_window_mode: int, key_drop: int, key_quit: int) -> Optional[str]:
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
@@ -36,6 +28,9 @@ def handle_events(state: GameState, key_toggle_window_mode: int, key_drop: int,
             if event.key == key_toggle_window_mode:
                 return "toggle_window_mode"
 
+            if event.key == pygame.K_F3:
+                return "toggle_profiler"
+
             if event.key == pygame.K_b:
                 return "bgm_toggle"
             if event.key in (pygame.K_LEFTBRACKET, pygame.K_MINUS):
@@ -52,14 +47,14 @@ def handle_events(state: GameState, key_toggle_window_mode: int, key_drop: int,
                 return "restart"
 
             if (not state.game_over) and event.key == key_drop:
-                _begin_drop(state)
+                begin_drop(state)
                 return None
 
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
                 if state.game_over:
                     return "restart"
-                _begin_drop(state)
+                begin_drop(state)
                 return None
 
     return None
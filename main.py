@@ -14,20 +14,28 @@ import pygame
 
 import config
 from audio import BgmPlayer
+from audio_loader import AudioLoader
 from audio_sfx import SfxPlayer
+from bgm_stream import BgmSequencer
 from camera import compute_target_cam_y
-from effects import update_effects
+from effects import update_effects, update_flash
 from input_handler import handle_events
 from models import GameState
-from render import draw_game
+from present import DirtyRectPresenter
+from profiler import FrameProfiler
+from quality import QualityGovernor
+from render import draw_game, invalidate_caches
 from save_data import (
     load_best, save_best,
     load_bgm_settings, save_bgm_settings,
     load_theme_settings, save_theme_settings,
     load_lifetime_perfect, save_lifetime_perfect,
     load_runs, append_run,
+    load_run_stats, save_run_stats,
+    close_store,
 )
 from spawner import reset_run
+from startup import StartupTimeline, init_subsystems, load_fonts
 from themes import next_theme_key, get_theme
 from update import update_game
 from window import create_screen
@@ -37,6 +45,45 @@ def _clamp01(v: float) -> float:
     return 0.0 if v < 0.0 else 1.0 if v > 1.0 else v
 
 
+def _step_sim(
+    state: GameState,
+    dt: float,
+    W: int,
+    floor_y: float,
+    view_bottom_y: float,
+    profiler: FrameProfiler,
+) -> float:
+    """한 시뮬레이션 스텝: 파티클/쉐이크 → flash → 게임. 쉐이크 오프셋 반환."""
+    # (2) 손맛: 파티클/쉐이크 업데이트
+    with profiler.phase("update_effects"):
+        shake_offset = update_effects(state, dt)
+
+    # flash 타이머
+    update_flash(state, dt)
+
+    with profiler.phase("update_game"):
+        update_game(
+            state,
+            dt=dt,
+            screen_w=W,
+            floor_y=floor_y,
+            hover_y=config.HOVER_Y,
+            block_h=config.BLOCK_H,
+            fall_speed=config.FALL_SPEED,
+            horizontal_speed=config.HORIZONTAL_SPEED,
+            edge_padding=config.EDGE_PADDING,
+            min_overlap_ratio=config.MIN_OVERLAP_RATIO,
+            perfect_ratio=config.PERFECT_RATIO,
+            flash_time=config.FLASH_TIME,
+            combo_every=config.COMBO_REWARD_EVERY,
+            combo_bonus=config.COMBO_WIDTH_BONUS,
+            shard_gravity=config.SHARD_GRAVITY,
+            shard_fall_speed=config.SHARD_FALL_SPEED,
+            view_bottom_y=view_bottom_y,
+        )
+    return shake_offset
+
+
 def _key_code_safe(name: str, fallback: int) -> int:
     aliases = {"ESC": "escape", "SPACE": "space", "F11": "f11", "ENTER": "return"}
     key_name = (name or "").strip()
@@ -85,13 +132,12 @@ def _cycle_theme(state: GameState, direction: int) -> None:
 
 
 def main() -> None:
-    try:
-        pygame.mixer.pre_init(44100, -16, 1, 512)
-    except Exception:
-        pass
+    timeline = StartupTimeline()
 
-    pygame.init()
+    # pygame.init() 대신 필요한 서브시스템만
+    init_subsystems()
     pygame.display.set_caption("ONE MORE BLOCK")
+    timeline.mark("init")
 
     key_toggle = _key_code_safe(config.KEY_TOGGLE_WINDOW_MODE, pygame.K_F11)
     key_quit = _key_code_safe(config.KEY_QUIT, pygame.K_ESCAPE)
@@ -101,11 +147,12 @@ def main() -> None:
     screen = create_screen(window_mode, (config.WINDOW_W, config.WINDOW_H))
     W, H = screen.get_size()
     floor_y = H - config.FLOOR_MARGIN
+    timeline.mark("window")
 
-    font_main = pygame.font.SysFont("consolas", 24)
-    font_hint = pygame.font.SysFont("consolas", 18)
-    font_flash = pygame.font.SysFont("consolas", 30)
+    # SysFont 시스템 폰트 스캔 대신 캐시된 경로
+    font_main, font_hint, font_flash = load_fonts(config.FONT_NAME, (24, 18, 30))
     clock = pygame.time.Clock()
+    timeline.mark("fonts")
 
     state = GameState()
 
@@ -127,14 +174,26 @@ def main() -> None:
     saved_lifetime = state.lifetime_perfect
 
     state.runs = load_runs()
-
-    # 오디오
-    bgm = BgmPlayer(on=state.bgm_on, volume=state.bgm_volume)
-    bgm.init()
-    bgm.apply()
+    state.run_stats = load_run_stats()
+    timeline.mark("save_load")
+
+    # 오디오: mixer/채널만 먼저, 버퍼는 워커가 만들어 루프에서 poll() 로 붙임
+    if config.BGM_STREAMING:
+        # 스트리밍은 미리 만들 버퍼가 없음 → 루프에서 bgm.update() 가 로더 워커에 청크 합성을 맡김
+        bgm = BgmSequencer(on=state.bgm_on, volume=state.bgm_volume)
+        bgm.init()
+    else:
+        bgm = BgmPlayer(on=state.bgm_on, volume=state.bgm_volume)
+        bgm.init(build=False)
 
     sfx = SfxPlayer()
-    sfx.init()
+    sfx.init(build=False)
+
+    audio_loader = AudioLoader([sfx] if config.BGM_STREAMING else [bgm, sfx])
+    if config.BGM_STREAMING:
+        bgm.loader = audio_loader
+    audio_loader.start(background=config.AUDIO_BACKGROUND_BUILD)
+    timeline.mark("audio")
 
     # 시작
     reset_run(
@@ -150,15 +209,30 @@ def main() -> None:
     cam_y = 0.0
     shake_offset = 0.0
 
+    presenter = DirtyRectPresenter() if config.DIRTY_RECT_PRESENT else None
+    governor = QualityGovernor(config.FPS) if config.QUALITY_GOVERNOR else None
+    profiler = FrameProfiler(capacity=4096)
+
     _try_unlocks(state)
 
+    # 고정 스텝: 누적기 + 직전 스텝의 현재 블록 위치(보간용)
+    sim_dt = 1.0 / config.SIM_HZ
+    sim_acc = 0.0
+    prev_cur = None
+
     while state.running:
         dt = clock.tick(config.FPS) / 1000.0
+        profiler.begin_frame()
 
-        # (2) 손맛: 파티클/쉐이크 업데이트
-        shake_offset = update_effects(state, dt)
+        # 대기 시간을 뺀 직전 프레임 작업 시간으로 품질 조절
+        if governor:
+            state.quality_level = governor.update(clock.get_rawtime() / 1000.0)
+
+        audio_loader.poll()
+        bgm.update(state.score)
 
-        cmd = handle_events(state, key_toggle, key_drop, key_quit)
+        with profiler.phase("handle_events"):
+            cmd = handle_events(state, key_toggle, key_drop, key_quit)
 
         # 창 모드 토글
         if cmd == "toggle_window_mode":
@@ -170,6 +244,9 @@ def main() -> None:
             screen = create_screen(window_mode, (config.WINDOW_W, config.WINDOW_H))
             W, H = screen.get_size()
             floor_y = H - config.FLOOR_MARGIN
+            invalidate_caches()
+            if presenter:
+                presenter.force_full()
 
             reset_run(
                 state,
@@ -194,6 +271,9 @@ def main() -> None:
             )
             cam_y = 0.0
 
+        elif cmd == "toggle_profiler":
+            profiler.toggle()
+
         # 테마 선택(게임 오버에서만)
         elif cmd == "theme_prev":
             _cycle_theme(state, -1)
@@ -228,102 +308,141 @@ def main() -> None:
             state.flash_text = f"BGM {int(state.bgm_volume * 100)}%"
             state.flash_timer = 0.6
 
-        # flash 타이머
-        if state.flash_timer > 0.0:
-            state.flash_timer = max(0.0, state.flash_timer - dt)
-            if state.flash_timer == 0.0:
-                state.flash_text = ""
-
         # update
         prev_perfect_total = state.run_total_perfect
-
-        update_game(
-            state,
-            dt=dt,
-            screen_w=W,
-            floor_y=floor_y,
-            hover_y=config.HOVER_Y,
-            block_h=config.BLOCK_H,
-            fall_speed=config.FALL_SPEED,
-            horizontal_speed=config.HORIZONTAL_SPEED,
-            edge_padding=config.EDGE_PADDING,
-            min_overlap_ratio=config.MIN_OVERLAP_RATIO,
-            perfect_ratio=config.PERFECT_RATIO,
-            flash_time=config.FLASH_TIME,
-            combo_every=config.COMBO_REWARD_EVERY,
-            combo_bonus=config.COMBO_WIDTH_BONUS,
-            shard_gravity=config.SHARD_GRAVITY,
-            shard_fall_speed=config.SHARD_FALL_SPEED,
-        )
+        # 카메라는 런 동안 위로만 움직이므로 지금 화면 아래로 빠진 shard 는 다시 안 보임
+        view_bottom = cam_y + H + state.shake_strength + 1.0
+
+        if config.FIXED_TIMESTEP:
+            sim_acc += dt
+            steps = 0
+            while sim_acc >= sim_dt and steps < config.MAX_SIM_STEPS_PER_FRAME:
+                c = state.current
+                prev_cur = (c, c.x, c.y) if c else None
+                shake_offset = _step_sim(state, sim_dt, W, floor_y, view_bottom, profiler)
+                sim_acc -= sim_dt
+                steps += 1
+            if sim_acc >= sim_dt:
+                # 너무 밀리면 따라잡기 포기(죽음의 나선 방지)
+                sim_acc = 0.0
+            alpha = sim_acc / sim_dt
+        else:
+            prev_cur = None
+            shake_offset = _step_sim(state, dt, W, floor_y, view_bottom, profiler)
+            alpha = 1.0
 
         # PERFECT 발생 → lifetime 증가 + SFX
         if state.run_total_perfect > prev_perfect_total:
             delta = state.run_total_perfect - prev_perfect_total
             state.lifetime_perfect += delta
-            sfx.play_click()
-
-        # best 저장
-        if state.best > saved_best:
-            save_best(state.best)
-            saved_best = state.best
-
-        # 해금 체크
-        if _try_unlocks(state):
-            save_theme_settings(state.selected_theme, state.unlocked_themes)
-            saved_theme = state.selected_theme
-            saved_unlocked = list(state.unlocked_themes)
-
-        # lifetime 저장
-        if state.lifetime_perfect != saved_lifetime:
-            save_lifetime_perfect(state.lifetime_perfect)
-            saved_lifetime = state.lifetime_perfect
-
-        # theme 저장
-        if state.selected_theme != saved_theme or state.unlocked_themes != saved_unlocked:
-            save_theme_settings(state.selected_theme, state.unlocked_themes)
-            saved_theme = state.selected_theme
-            saved_unlocked = list(state.unlocked_themes)
-
-        # bgm 저장
-        if state.bgm_on != saved_bgm_on or abs(state.bgm_volume - saved_bgm_vol) > 1e-6:
-            save_bgm_settings(state.bgm_on, state.bgm_volume)
-            saved_bgm_on = state.bgm_on
-            saved_bgm_vol = state.bgm_volume
-
-        # (3) 런 기록 저장 (1회만)
-        if state.game_over and not state.game_over_recorded:
-            record = {
-                "time": datetime.now().strftime("%Y-%m-%d %H:%M"),
-                "score": state.score,
-                "perfect": state.run_total_perfect,
-                "max_combo": state.run_max_combo,
-                "skin": state.selected_theme,
-            }
-            append_run(record, limit=30)
-            state.runs.insert(0, record)
-            state.runs = state.runs[:30]
-            state.game_over_recorded = True
+            sfx.play_click(state.perfect_combo)
+
+        with profiler.phase("save"):
+            # best 저장
+            if state.best > saved_best:
+                save_best(state.best)
+                saved_best = state.best
+
+            # 해금 체크
+            if _try_unlocks(state):
+                save_theme_settings(state.selected_theme, state.unlocked_themes)
+                saved_theme = state.selected_theme
+                saved_unlocked = list(state.unlocked_themes)
+
+            # lifetime 저장
+            if state.lifetime_perfect != saved_lifetime:
+                save_lifetime_perfect(state.lifetime_perfect)
+                saved_lifetime = state.lifetime_perfect
+
+            # theme 저장
+            if state.selected_theme != saved_theme or state.unlocked_themes != saved_unlocked:
+                save_theme_settings(state.selected_theme, state.unlocked_themes)
+                saved_theme = state.selected_theme
+                saved_unlocked = list(state.unlocked_themes)
+
+            # bgm 저장
+            if state.bgm_on != saved_bgm_on or abs(state.bgm_volume - saved_bgm_vol) > 1e-6:
+                save_bgm_settings(state.bgm_on, state.bgm_volume)
+                saved_bgm_on = state.bgm_on
+                saved_bgm_vol = state.bgm_volume
+
+            # (3) 런 기록 저장 (1회만)
+            if state.game_over and not state.game_over_recorded:
+                record = {
+                    "time": datetime.now().strftime("%Y-%m-%d %H:%M"),
+                    "score": state.score,
+                    "perfect": state.run_total_perfect,
+                    "max_combo": state.run_max_combo,
+                    "skin": state.selected_theme,
+                }
+                append_run(record, limit=30)
+                state.runs.insert(0, record)
+                state.runs = state.runs[:30]
+                state.run_stats.add_run(record)
+                save_run_stats(state.run_stats)
+                state.game_over_recorded = True
 
         # 카메라
-        target_cam = compute_target_cam_y(state, config.CAMERA_TOP_MARGIN)
-        cam_y += (target_cam - cam_y) * min(1.0, config.CAMERA_SMOOTH * dt)
+        with profiler.phase("camera"):
+            target_cam = compute_target_cam_y(state, config.CAMERA_TOP_MARGIN)
+            cam_y += (target_cam - cam_y) * min(1.0, config.CAMERA_SMOOTH * dt)
+            if presenter and abs(target_cam - cam_y) < 0.05:
+                # 서브픽셀 꼬리는 스냅 → 카메라가 멈춘 프레임은 dirty-rect 부분 갱신 가능
+                cam_y = target_cam
 
         cam_draw = cam_y + shake_offset
 
-        draw_game(
-            screen,
-            font_main=font_main,
-            font_hint=font_hint,
-            font_flash=font_flash,
-            state=state,
-            cam_y=cam_draw,
-            screen_size=(W, H),
-            floor_y=floor_y,
-            theme_key=state.selected_theme,
-        )
+        # 렌더 보간: 마지막 두 스텝 사이 alpha 지점
+        cur_pos = None
+        render_time = state.sim_time
+        if config.FIXED_TIMESTEP:
+            render_time -= (1.0 - alpha) * sim_dt
+            if prev_cur and prev_cur[0] is state.current:
+                c = state.current
+                cur_pos = (prev_cur[1] + (c.x - prev_cur[1]) * alpha, prev_cur[2] + (c.y - prev_cur[2]) * alpha)
+
+        if presenter:
+            if profiler.enabled:
+                presenter.force_full()
+            presenter.prepare(
+                screen, state, cam_draw, (W, H), state.selected_theme,
+                current_pos=cur_pos, render_time=render_time,
+            )
+
+        with profiler.phase("draw_game"):
+            # dirty-rect 부분 갱신이면 clip 마다 한 번씩
+            for clip in presenter.clips() if presenter else (None,):
+                if presenter:
+                    screen.set_clip(clip)
+                draw_game(
+                    screen,
+                    font_main=font_main,
+                    font_hint=font_hint,
+                    font_flash=font_flash,
+                    state=state,
+                    cam_y=cam_draw,
+                    screen_size=(W, H),
+                    floor_y=floor_y,
+                    theme_key=state.selected_theme,
+                    current_pos=cur_pos,
+                    render_time=render_time,
+                )
+        profiler.draw(screen, font_hint)
+
+        with profiler.phase("flip"):
+            if presenter:
+                presenter.present(screen)
+            else:
+                pygame.display.flip()
+
+        profiler.end_frame()
 
-        pygame.display.flip()
+        if not timeline.finished:
+            timeline.mark("first_frame")
+            timeline.finish()
 
+    # 남은 저장 flush (워커 스레드 기록 대기)
+    close_store()
     pygame.quit()
     sys.exit()
 
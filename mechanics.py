@@ -9,19 +9,21 @@ from models import Block, GameState
 
 
 def top_surface_y(state: GameState, floor_y: float) -> float:
-    if not state.stack:
-        return float(floor_y)
-    return float(min(b.y for b in state.stack))
+    return float(state.stack_index.top_y(floor_y))
 
 
 def get_top_block(state: GameState) -> Optional[Block]:
-    if not state.stack:
-        return None
-    top_y = min(b.y for b in state.stack)
-    for b in state.stack:
-        if abs(b.y - top_y) < 0.001:
-            return b
-    return None
+    return state.stack_index.top
+
+
+def begin_drop(state: GameState) -> None:
+    if not state.current:
+        return
+    if state.current.phase != "move":
+        return
+    state.current._orig_x = state.current.x
+    state.current._orig_w = state.current.w
+    state.current.phase = "drop"
 
 
 def compute_overlap(a: Block, b: Block) -> Tuple[float, float, float]:
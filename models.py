@@ -8,20 +8,32 @@ from __future__ import annotations
 (3) 런 기록/누적 perfect
 """
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple, Dict, Any
 
+from particles import ParticlePool
+from run_stats import RunStats
+from shards import ShardSet
+
 Color = Tuple[int, int, int]
 
 
 @dataclass
 class BlockShard:
+    """y/vy 는 생성 시각 t0 기준 초기값, 위치는 y_at(t) 로 계산."""
     x: float
     y: float
     w: float
     h: float
     color: Color
     vy: float = 0.0
+    t0: float = 0.0
+    gravity: float = 0.0
+
+    def y_at(self, t: float) -> float:
+        dt = max(0.0, t - self.t0)
+        return self.y + self.vy * dt + 0.5 * self.gravity * dt * dt
 
 
 @dataclass
@@ -38,16 +50,60 @@ class Block:
     _orig_w: float = 0.0
 
 
-@dataclass
-class Particle:
-    x: float
-    y: float
-    vx: float
-    vy: float
-    size: int
-    color: Color
-    life: float
-    age: float = 0.0
+class StackIndex:
+    """settled 블록의 y 인덱스 (증분 유지).
+
+    key = -y 오름차순 → 위로 쌓일수록 뒤에 붙으므로 보통 append 로 O(1).
+    top / top_y / height_range: O(1), y 구간 검색: O(log n).
+    """
+
+    def __init__(self) -> None:
+        self._keys: List[float] = []
+        self._blocks: List[Block] = []
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._blocks.clear()
+
+    def add(self, b: Block) -> None:
+        k = -b.y
+        if not self._keys or k > self._keys[-1]:
+            self._keys.append(k)
+            self._blocks.append(b)
+            return
+        # 같은 y 는 먼저 들어온 블록이 top 으로 남도록 앞쪽에 삽입
+        i = bisect_left(self._keys, k)
+        self._keys.insert(i, k)
+        self._blocks.insert(i, b)
+
+    def pop(self) -> Optional[Block]:
+        """top 블록 제거 (push 의 되돌리기)."""
+        if not self._blocks:
+            return None
+        self._keys.pop()
+        return self._blocks.pop()
+
+    @property
+    def top(self) -> Optional[Block]:
+        return self._blocks[-1] if self._blocks else None
+
+    def top_y(self, default: float) -> float:
+        return -self._keys[-1] if self._keys else float(default)
+
+    def height_range(self) -> Optional[Tuple[float, float]]:
+        """(가장 위 블록 y, 가장 아래 블록 y)"""
+        if not self._keys:
+            return None
+        return -self._keys[-1], -self._keys[0]
+
+    def blocks_in_range(self, y0: float, y1: float) -> List[Block]:
+        """y0 <= b.y <= y1 인 블록 (아래 → 위 순서)"""
+        lo = bisect_left(self._keys, -y1)
+        hi = bisect_right(self._keys, -y0)
+        return self._blocks[lo:hi]
 
 
 @dataclass
@@ -56,7 +112,10 @@ class GameState:
 
     current: Optional[Block] = None
     stack: List[Block] = field(default_factory=list)
-    shards: List[BlockShard] = field(default_factory=list)
+    stack_index: StackIndex = field(default_factory=StackIndex, repr=False)
+    shards: ShardSet = field(default_factory=ShardSet, repr=False)
+    # update_game 누적 시간 (shard 위치 계산 기준)
+    sim_time: float = 0.0
 
     score: int = 0
     best: int = 0
@@ -78,11 +137,14 @@ class GameState:
     bgm_volume: float = 0.25
 
     # (2) 손맛 효과
-    particles: List[Particle] = field(default_factory=list)
+    particles: ParticlePool = field(default_factory=ParticlePool, repr=False)
     shake_timer: float = 0.0
     shake_duration: float = 0.12
     shake_strength: float = 10.0
 
+    # quality.QUALITY_LEVELS 인덱스 (0 = 최고)
+    quality_level: int = 0
+
     # (1) 테마/해금
     selected_theme: str = "sky"
     unlocked_themes: List[str] = field(default_factory=lambda: ["sky"])
@@ -90,3 +152,19 @@ class GameState:
     # (3) 누적/런 기록
     lifetime_perfect: int = 0
     runs: List[Dict[str, Any]] = field(default_factory=list)
+    run_stats: RunStats = field(default_factory=RunStats, repr=False)
+
+    def push_block(self, b: Block) -> None:
+        self.stack.append(b)
+        self.stack_index.add(b)
+
+    def pop_block(self) -> Optional[Block]:
+        """마지막으로 쌓은 블록 제거 (그 블록이 top 일 때만 인덱스와 일치)."""
+        if not self.stack:
+            return None
+        self.stack_index.pop()
+        return self.stack.pop()
+
+    def clear_stack(self) -> None:
+        self.stack.clear()
+        self.stack_index.clear()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+"""particles.py
+
+고정 용량 파티클 풀 (struct-of-arrays).
+- x/y/vx/vy/size/life/age/색을 배열로 보관, 살아있는 것은 항상 [0:n] 구간
+- update 한 번에 전체 적분 + 마스크로 압축 (list.remove 없음)
+- NumPy 가 없으면 같은 구조의 파이썬 리스트로 동작
+- 용량을 넘는 방출은 버림
+- 난수는 전역 random 이 아니라 FX_RNG(연출 전용) → 품질 단계/프레임 시간에 따라 방출 수가 달라져도
+  게임 쪽 random 흐름(블록 색/폭/위치)은 그대로
+"""
+
+import random
+from typing import Iterator, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy 없는 환경
+    np = None
+
+Color = Tuple[int, int, int]
+
+PARTICLE_CAPACITY = 8192
+
+# 파티클/흔들림 등 연출 전용 난수 (시뮬레이터는 seed_fx 로 같이 시드)
+FX_RNG = random.Random()
+
+
+def seed_fx(seed: Optional[int]) -> None:
+    FX_RNG.seed(seed)
+
+_FIELDS = ("x", "y", "vx", "vy", "size", "life", "age", "r", "g", "b")
+
+
+class ParticlePool:
+    def __init__(self, capacity: int = PARTICLE_CAPACITY, rng: Optional[random.Random] = None) -> None:
+        self.capacity = max(1, int(capacity))
+        self.rng = rng if rng is not None else FX_RNG
+        self.n = 0
+        if np is not None:
+            for name in _FIELDS:
+                dtype = np.uint8 if name in ("r", "g", "b") else np.float32 if name != "size" else np.int32
+                setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+        else:
+            for name in _FIELDS:
+                setattr(self, name, [])
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __bool__(self) -> bool:
+        return self.n > 0
+
+    def clear(self) -> None:
+        self.n = 0
+        if np is None:
+            for name in _FIELDS:
+                getattr(self, name).clear()
+
+    def emit_burst(
+        self,
+        count: int,
+        x: float,
+        y: float,
+        color: Color,
+        spread: Tuple[float, float],
+        speed_x: Tuple[float, float],
+        speed_y: Tuple[float, float],
+        size: Tuple[int, int],
+        life: Tuple[float, float],
+    ) -> int:
+        """(x, y) 주변에 count 개 방출. 실제로 들어간 개수 반환."""
+        k = max(0, min(int(count), self.capacity - self.n))
+        if k == 0:
+            return 0
+
+        if np is not None:
+            # 연출 난수에서 시드 한 번만 뽑음 → 시뮬레이터 seed 로 재현 가능
+            rng = np.random.default_rng(self.rng.getrandbits(32))
+            s, e = self.n, self.n + k
+            self.x[s:e] = x + rng.uniform(-spread[0], spread[0], k)
+            self.y[s:e] = y + rng.uniform(-spread[1], spread[1], k)
+            self.vx[s:e] = rng.uniform(speed_x[0], speed_x[1], k)
+            self.vy[s:e] = rng.uniform(speed_y[0], speed_y[1], k)
+            self.size[s:e] = rng.integers(size[0], size[1] + 1, k)
+            self.life[s:e] = rng.uniform(life[0], life[1], k)
+            self.age[s:e] = 0.0
+            self.r[s:e], self.g[s:e], self.b[s:e] = color
+        else:
+            rnd = self.rng
+            for _ in range(k):
+                self.x.append(x + rnd.uniform(-spread[0], spread[0]))
+                self.y.append(y + rnd.uniform(-spread[1], spread[1]))
+                self.vx.append(rnd.uniform(speed_x[0], speed_x[1]))
+                self.vy.append(rnd.uniform(speed_y[0], speed_y[1]))
+                self.size.append(rnd.randint(size[0], size[1]))
+                self.life.append(rnd.uniform(life[0], life[1]))
+                self.age.append(0.0)
+                self.r.append(color[0])
+                self.g.append(color[1])
+                self.b.append(color[2])
+
+        self.n += k
+        return k
+
+    def update(self, dt: float, gravity: float) -> None:
+        n = self.n
+        if n == 0:
+            return
+
+        if np is not None:
+            age = self.age[:n]
+            age += dt
+            keep = age < self.life[:n]
+            k = int(np.count_nonzero(keep))
+            if k != n:
+                for name in _FIELDS:
+                    a = getattr(self, name)
+                    a[:k] = a[:n][keep]
+                self.n = n = k
+            self.vy[:n] += gravity * dt
+            self.x[:n] += self.vx[:n] * dt
+            self.y[:n] += self.vy[:n] * dt
+            return
+
+        age = [a + dt for a in self.age]
+        keep = [i for i in range(n) if age[i] < self.life[i]]
+        self.age = age
+        if len(keep) != n:
+            for name in _FIELDS:
+                src = getattr(self, name)
+                setattr(self, name, [src[i] for i in keep])
+            self.n = n = len(keep)
+        self.vy = [v + gravity * dt for v in self.vy]
+        self.x = [p + v * dt for p, v in zip(self.x, self.vx)]
+        self.y = [p + v * dt for p, v in zip(self.y, self.vy)]
+
+    def items(self) -> Iterator[Tuple[float, float, int, Color]]:
+        """그리기용 (x, y, size, color)"""
+        n = self.n
+        if n == 0:
+            return iter(())
+
+        def _lst(a):
+            return a[:n].tolist() if np is not None else a
+
+        colors = zip(_lst(self.r), _lst(self.g), _lst(self.b))
+        return zip(_lst(self.x), _lst(self.y), _lst(self.size), colors)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+"""present.py
+
+dirty-rect 표시 모드 (config.DIRTY_RECT_PRESENT).
+- 바뀐 영역(현재 블록 이전/현재 위치, 파티클, shard, HUD 줄, 새로 쌓인 블록)만 모음
+- 가까운 영역끼리만 합쳐 clip 몇 개로 묶고(HUD 띠와 플레이 영역은 따로), clip 마다 다시 그린 뒤
+  display.update(clips) 로 표시
+- 카메라 이동/흔들림, 화면 크기/테마/품질 단계 변경, 런 리셋, 게임오버 전환 시에는 전체 다시 그리기 + flip
+"""
+
+from typing import List, Optional, Tuple
+import pygame
+from models import GameState
+
+# HUD 줄 + hint + flash 텍스트가 들어가는 상단 띠 높이
+HUD_BAND_H = 130
+
+# 합친 사각형 넓이가 두 넓이 합의 이 배수 이하일 때만 합침
+MERGE_SLACK = 1.25
+# clip 이 이보다 많으면 넓이가 가장 적게 느는 쌍부터 합침 (draw_game 호출 수 상한)
+MAX_CLIPS = 4
+
+
+def _world_rect(x: float, y: float, w: float, h: float, cam_y: float, pad: int = 2) -> pygame.Rect:
+    return pygame.Rect(int(x) - pad, int(y - cam_y) - pad, int(w) + pad * 2, int(h) + pad * 2)
+
+
+def _area(r: pygame.Rect) -> int:
+    return r.w * r.h
+
+
+def merge_rects(rects: List[pygame.Rect], max_rects: int = MAX_CLIPS) -> List[pygame.Rect]:
+    """겹치거나 가까운 사각형만 합침 → 서로 먼 영역(HUD 띠 / 현재 블록 / 파티클)은 따로 남음."""
+    out: List[pygame.Rect] = []
+    for r in rects:
+        r = pygame.Rect(r)
+        merged = True
+        while merged:
+            merged = False
+            for i, o in enumerate(out):
+                u = o.union(r)
+                if _area(u) <= (_area(o) + _area(r)) * MERGE_SLACK:
+                    out.pop(i)
+                    r = u
+                    merged = True
+                    break
+        out.append(r)
+
+    while len(out) > max(1, max_rects):
+        best = None
+        for i in range(len(out)):
+            for j in range(i + 1, len(out)):
+                grow = _area(out[i].union(out[j])) - _area(out[i]) - _area(out[j])
+                if best is None or grow < best[0]:
+                    best = (grow, i, j)
+        _, i, j = best
+        u = out[i].union(out[j])
+        out.pop(j)
+        out[i] = u
+    return out
+
+
+class DirtyRectPresenter:
+    def __init__(self) -> None:
+        self._prev_rects: List[pygame.Rect] = []
+        self._prev_cam: Optional[float] = None
+        self._prev_key: Optional[Tuple] = None
+        self._prev_stack_len = 0
+        self._clips: Optional[List[pygame.Rect]] = None
+
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def force_full(self) -> None:
+        self._prev_key = None
+
+    def _collect(
+        self,
+        state: GameState,
+        cam_y: float,
+        W: int,
+        H: int,
+        current_pos: Optional[Tuple[float, float]],
+        render_time: float,
+    ) -> List[pygame.Rect]:
+        screen_rect = pygame.Rect(0, 0, W, H)
+        rects = [pygame.Rect(0, 0, W, HUD_BAND_H)]
+
+        if state.current:
+            c = state.current
+            cx, cy = current_pos if current_pos is not None else (c.x, c.y)
+            rects.append(_world_rect(cx, cy, c.w, c.h, cam_y))
+
+        # 새로 쌓인 블록 (타워 캐시에 추가로 그려짐)
+        for b in state.stack[self._prev_stack_len:]:
+            rects.append(_world_rect(b.x, b.y, b.w, b.h, cam_y))
+
+        for s in state.shards:
+            r = _world_rect(s.x, s.y_at(render_time), s.w, s.h, cam_y)
+            if r.colliderect(screen_rect):
+                rects.append(r)
+
+        # 파티클은 한 무더기로 모여 있으니 bounding box 하나로
+        pr: Optional[pygame.Rect] = None
+        for px, py, size, _ in state.particles.items():
+            r = _world_rect(px, py, size, size, cam_y)
+            pr = r if pr is None else pr.union(r)
+        if pr is not None and pr.colliderect(screen_rect):
+            rects.append(pr)
+
+        return [r.clip(screen_rect) for r in rects]
+
+    def prepare(
+        self,
+        screen: pygame.Surface,
+        state: GameState,
+        cam_y: float,
+        screen_size: Tuple[int, int],
+        theme_key: str,
+        current_pos: Optional[Tuple[float, float]] = None,
+        render_time: Optional[float] = None,
+    ) -> None:
+        """draw_game 전에 호출: 이번 프레임을 전체/부분 갱신 중 무엇으로 할지 정함 (clips() 참고).
+
+        current_pos / render_time 은 draw_game 에 넘기는 보간값과 같아야 함.
+        """
+        W, H = screen_size
+        base = state.stack[0] if state.stack else None
+        # 품질 단계가 바뀌면 배경 딤/모서리가 화면 전체에서 바뀜 → 전체 다시 그리기
+        key = (W, H, theme_key, state.game_over, id(base), state.quality_level)
+
+        t = state.sim_time if render_time is None else render_time
+        cur = self._collect(state, cam_y, W, H, current_pos, t)
+
+        full = (key != self._prev_key) or (cam_y != self._prev_cam)
+        screen.set_clip(None)
+        if full:
+            self._clips = None
+        else:
+            self._clips = merge_rects([r for r in cur + self._prev_rects if r.w > 0 and r.h > 0])
+
+        self._prev_rects = cur
+        self._prev_cam = cam_y
+        self._prev_key = key
+        self._prev_stack_len = len(state.stack)
+
+    def clips(self) -> List[Optional[pygame.Rect]]:
+        """이번 프레임에 draw_game 을 돌릴 clip 목록 (전체 갱신이면 [None])."""
+        return [None] if self._clips is None else list(self._clips)
+
+    def present(self, screen: pygame.Surface) -> None:
+        screen.set_clip(None)
+        if self._clips is None:
+            self.full_frames += 1
+            pygame.display.flip()
+        else:
+            self.partial_frames += 1
+            pygame.display.update(self._clips)
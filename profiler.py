@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+"""profiler.py
+
+프레임 단계별 시간 측정 + 오버레이 (F3).
+- 단계: handle_events / update_effects / update_game / save / camera / draw_game / flip (+ frame 전체)
+- 단계마다 최근 N 프레임 링버퍼, p50/p95/p99/worst 표시
+- 꺼져 있으면 측정 자체를 건너뜀
+"""
+
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+import pygame
+
+PHASES: Tuple[str, ...] = (
+    "handle_events",
+    "update_effects",
+    "update_game",
+    "save",
+    "camera",
+    "draw_game",
+    "flip",
+    "frame",
+)
+
+STATS_REFRESH_FRAMES = 15
+
+
+class _Phase:
+    __slots__ = ("prof", "name", "t0")
+
+    def __init__(self, prof: "FrameProfiler", name: str) -> None:
+        self.prof = prof
+        self.name = name
+        self.t0 = 0.0
+
+    def __enter__(self) -> None:
+        if self.prof.enabled:
+            self.t0 = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        if self.prof.enabled:
+            self.prof.add(self.name, time.perf_counter() - self.t0)
+
+
+def _percentile(sorted_vals: List[float], q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    i = min(len(sorted_vals) - 1, max(0, int(round(q * (len(sorted_vals) - 1)))))
+    return sorted_vals[i]
+
+
+class FrameProfiler:
+    def __init__(self, capacity: int = 4096, enabled: bool = False) -> None:
+        self.capacity = max(1, int(capacity))
+        self.enabled = enabled
+
+        self._rings: Dict[str, array] = {p: array("d", bytes(8 * self.capacity)) for p in PHASES}
+        self._phases: Dict[str, _Phase] = {p: _Phase(self, p) for p in PHASES}
+        self._cur: Dict[str, float] = {p: 0.0 for p in PHASES}
+        self._idx = 0
+        self._count = 0
+        self._frame_t0 = 0.0
+        self._frame_valid = False  # begin_frame 이 켜진 상태로 불렸는지 (중간에 켠 프레임은 버림)
+
+        self._since_refresh = STATS_REFRESH_FRAMES
+        self._panel: Optional[pygame.Surface] = None
+
+    def toggle(self) -> None:
+        self.enabled = not self.enabled
+        self.reset()
+
+    def reset(self) -> None:
+        self._idx = 0
+        self._count = 0
+        self._since_refresh = STATS_REFRESH_FRAMES
+        self._panel = None
+        self._frame_valid = False
+        for p in PHASES:
+            self._cur[p] = 0.0
+
+    def phase(self, name: str) -> _Phase:
+        """with prof.phase("draw_game"): ... — 한 프레임에 여러 번 들어가면 합산"""
+        return self._phases[name]
+
+    def add(self, name: str, seconds: float) -> None:
+        self._cur[name] += seconds
+
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        for p in PHASES:
+            self._cur[p] = 0.0
+        self._frame_t0 = time.perf_counter()
+        self._frame_valid = True
+
+    def end_frame(self) -> None:
+        if not self.enabled or not self._frame_valid:
+            return
+        self._frame_valid = False
+        self._cur["frame"] = time.perf_counter() - self._frame_t0
+        i = self._idx
+        for p in PHASES:
+            self._rings[p][i] = self._cur[p]
+        self._idx = (i + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self._since_refresh += 1
+
+    def stats(self, name: str) -> Dict[str, float]:
+        vals = sorted(self._rings[name][: self._count])
+        return {
+            "p50": _percentile(vals, 0.50),
+            "p95": _percentile(vals, 0.95),
+            "p99": _percentile(vals, 0.99),
+            "worst": vals[-1] if vals else 0.0,
+        }
+
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font, color: Tuple[int, int, int] = (235, 240, 250)) -> None:
+        if not self.enabled:
+            return
+
+        # 정렬 비용 때문에 통계/텍스트는 몇 프레임마다만 갱신
+        if self._since_refresh >= STATS_REFRESH_FRAMES:
+            self._since_refresh = 0
+            rows = [f"{'ms':<14}{'p50':>7}{'p95':>7}{'p99':>7}{'worst':>7}   n={self._count}"]
+            for p in PHASES:
+                s = self.stats(p)
+                rows.append(
+                    f"{p:<14}{s['p50'] * 1000:>7.2f}{s['p95'] * 1000:>7.2f}"
+                    f"{s['p99'] * 1000:>7.2f}{s['worst'] * 1000:>7.2f}"
+                )
+            lines = [font.render(r, True, color) for r in rows]
+
+            pad = 8
+            w = max(l.get_width() for l in lines) + pad * 2
+            h = sum(l.get_height() for l in lines) + pad * 2
+            panel = pygame.Surface((w, h), pygame.SRCALPHA)
+            panel.fill((0, 0, 0, 170))
+            ty = pad
+            for l in lines:
+                panel.blit(l, (pad, ty))
+                ty += l.get_height()
+            self._panel = panel
+
+        if self._panel is not None:
+            screen.blit(self._panel, (screen.get_width() - self._panel.get_width() - 12, 12))
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+"""quality.py
+
+프레임 시간 예산(config.FPS) 기반 품질 조절.
+- 프레임 작업 시간(clock.get_rawtime, 대기 시간 제외)의 EMA 를 예산과 비교
+- 예산 초과가 이어지면 한 단계 낮추고, 여유가 오래 이어지면 한 단계 올림
+- 단계 변경 후 쿨다운 + 올림/내림 기준을 다르게 둬서(히스테리시스) 깜빡임 방지
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    name: str
+    particle_scale: float  # effects.trigger_perfect 파티클 수 배율
+    shake_scale: float     # 카메라 흔들림 세기 배율
+    bg_dim: bool           # 배경/바닥 딤
+    rounded: bool          # 블록 둥근 모서리
+
+
+QUALITY_LEVELS: List[QualityLevel] = [
+    QualityLevel("high", particle_scale=1.0, shake_scale=1.0, bg_dim=True, rounded=True),
+    QualityLevel("medium", particle_scale=0.5, shake_scale=1.0, bg_dim=True, rounded=True),
+    QualityLevel("low", particle_scale=0.25, shake_scale=0.5, bg_dim=False, rounded=True),
+    QualityLevel("minimal", particle_scale=0.0, shake_scale=0.0, bg_dim=False, rounded=False),
+]
+
+
+def get_quality(level: int) -> QualityLevel:
+    return QUALITY_LEVELS[max(0, min(level, len(QUALITY_LEVELS) - 1))]
+
+
+class QualityGovernor:
+    def __init__(
+        self,
+        fps: int,
+        down_ratio: float = 1.10,
+        up_ratio: float = 0.65,
+        down_after: int = 20,
+        up_after: int = 180,
+        cooldown: int = 60,
+        smoothing: float = 0.1,
+    ) -> None:
+        self.budget = 1.0 / max(1, int(fps))
+        self.down_ratio = down_ratio
+        self.up_ratio = up_ratio
+        self.down_after = down_after
+        self.up_after = up_after
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+
+        self.level = 0
+        self.ema = 0.0
+        self._over = 0
+        self._under = 0
+        self._cool = 0
+
+    def update(self, frame_time: float) -> int:
+        """frame_time(초) 를 반영하고 현재 단계 반환."""
+        if self.ema <= 0.0:
+            self.ema = frame_time
+        else:
+            self.ema += (frame_time - self.ema) * self.smoothing
+
+        if self._cool > 0:
+            self._cool -= 1
+            return self.level
+
+        if self.ema > self.budget * self.down_ratio:
+            self._over += 1
+            self._under = 0
+        elif self.ema < self.budget * self.up_ratio:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = 0
+            self._under = 0
+
+        if self._over >= self.down_after and self.level < len(QUALITY_LEVELS) - 1:
+            self._set(self.level + 1)
+        elif self._under >= self.up_after and self.level > 0:
+            self._set(self.level - 1)
+
+        return self.level
+
+    def _set(self, level: int) -> None:
+        self.level = level
+        self._over = 0
+        self._under = 0
+        self._cool = self.cooldown
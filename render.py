@@ -5,21 +5,273 @@ from __future__ import annotations
 - 테마 적용
 - 배경/바닥만 딤(눈부심 완화)
 - 파티클/런기록 표시
+- 게임오버: 누적 통계(run_stats, 기록 재스캔 없음) + perfect 비율 히스토그램
+- 화면 밖 블록/shard/파티클은 건너뜀(컬링)
+- settled 타워는 세로 타일 surface 에 한 번만 그려두고 카메라 오프셋으로 blit
 """
 
-from typing import Tuple
+import math
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 import pygame
-from models import GameState
-from themes import get_theme
+from models import Block, GameState
+from quality import get_quality
+from run_stats import RunStats
+from sprite_cache import SpriteCache
+from text_cache import TextCache
+from themes import Theme, get_theme
 
+TOWER_TILE_H = 512
+# 타일 폭 = 타워 x 범위 + 양쪽 여유 (범위를 넘는 블록이 오면 넓혀서 다시 구움)
+TOWER_COL_PAD = 32
+TOWER_COLORKEY = (255, 0, 255)
+
+
+WHITE = (255, 255, 255)
+
+
+def _block_layers(w: int, h: int, color, theme: Theme, rounded: bool = True) -> List[pygame.Surface]:
+    """블록 sprite 레이어 (아래 → 위).
+
+    모양(외곽선 + 흰 마스크)만 캐시하고 색은 블록마다 마스크에 곱함 → 블록 색이 제각각이어도 캐시 재사용.
+    """
+    radius = 10 if rounded else 0
+    layers: List[pygame.Surface] = []
 
-def _draw_block(screen: pygame.Surface, rect: pygame.Rect, color, theme) -> None:
     if theme.block_outline:
-        pygame.draw.rect(screen, theme.outline_color, rect, border_radius=10)
-        inner = rect.inflate(-theme.outline_width * 2, -theme.outline_width * 2)
-        pygame.draw.rect(screen, color, inner, border_radius=9)
+        layers.append(sprite_cache.get(
+            (w, h, theme.key, rounded, "outline"),
+            lambda surf, rect: pygame.draw.rect(surf, theme.outline_color, rect, border_radius=radius),
+        ))
+        ow = theme.outline_width
+        mask = sprite_cache.get(
+            (w, h, theme.key, rounded, "fill"),
+            lambda surf, rect: pygame.draw.rect(surf, WHITE, rect.inflate(-ow * 2, -ow * 2), border_radius=max(0, radius - 1)),
+        )
     else:
-        pygame.draw.rect(screen, color, rect, border_radius=10)
+        mask = sprite_cache.get(
+            (w, h, theme.key, rounded, "fill"),
+            lambda surf, rect: pygame.draw.rect(surf, WHITE, rect, border_radius=radius),
+        )
+
+    # 흰색 × color = color (투명 부분은 그대로)
+    fill = mask.copy()
+    fill.fill(color, special_flags=pygame.BLEND_RGB_MULT)
+    layers.append(fill)
+    return layers
+
+
+class TowerLayer:
+    """settled 블록 캐시 레이어.
+
+    - 월드 y 를 TOWER_TILE_H 단위 타일로 나눠, 타일마다 블록을 한 번만 래스터
+    - 타일 폭은 화면 폭이 아니라 쌓인 블록의 x 범위(+여유) → 넓은 화면에서도 타일 메모리가 타워 폭만큼
+    - 새로 settled 된 블록만 이미 있는 타일에 추가로 그림
+    - 타일은 화면에 보이는 개수 + 여유분만 LRU 로 유지, 빠진 타일은 stack_index 범위 검색으로 다시 구움
+    - 테마/화면 폭/모서리 품질이 바뀌거나 런이 리셋되면 전부 버림
+    """
+
+    def __init__(self) -> None:
+        self._tiles: "OrderedDict[int, pygame.Surface]" = OrderedDict()
+        self._key: Optional[Tuple[str, int, bool]] = None
+        self._base: Optional[Block] = None
+        self._baked = 0
+        self._max_h = 0.0
+        self._rounded = True
+        self._col_x0 = 0
+        self._col_x1 = 0
+
+    def invalidate(self) -> None:
+        self._tiles.clear()
+        self._key = None
+        self._base = None
+        self._baked = 0
+        self._max_h = 0.0
+        self._col_x0 = 0
+        self._col_x1 = 0
+
+    def _fit_column(self, blocks) -> None:
+        """blocks 가 타일 열 밖으로 나가면 열을 넓히고 타일을 버림 (다음 draw 에서 다시 구움)."""
+        x0, x1 = self._col_x0, self._col_x1
+        for b in blocks:
+            bx0 = int(b.x)
+            bx1 = bx0 + int(b.w)
+            if x1 <= x0:
+                x0, x1 = bx0, bx1
+            else:
+                x0 = min(x0, bx0)
+                x1 = max(x1, bx1)
+        if x0 < self._col_x0 or x1 > self._col_x1 or self._col_x1 <= self._col_x0:
+            if x1 > x0:
+                self._col_x0 = x0 - TOWER_COL_PAD
+                self._col_x1 = x1 + TOWER_COL_PAD
+                self._tiles.clear()
+
+    def _sync(self, state: GameState, theme: Theme, W: int, rounded: bool) -> None:
+        key = (theme.key, W, rounded)
+        stack = state.stack
+        base = stack[0] if stack else None
+        if key != self._key or base is not self._base or len(stack) < self._baked:
+            self.invalidate()
+            self._key = key
+            self._base = base
+            self._rounded = rounded
+
+        self._fit_column(stack[self._baked:])
+        for b in stack[self._baked:]:
+            self._max_h = max(self._max_h, b.h)
+            i0 = int(b.y // TOWER_TILE_H)
+            i1 = int((b.y + b.h) // TOWER_TILE_H)
+            for ti in range(i0, i1 + 1):
+                tile = self._tiles.get(ti)
+                if tile is not None:
+                    self._paint(tile, ti, (b,), theme)
+        self._baked = len(stack)
+
+    def _paint(self, tile: pygame.Surface, ti: int, blocks, theme: Theme) -> None:
+        top = ti * TOWER_TILE_H
+        SpriteCache.draw_all(
+            tile,
+            (
+                (layer, (int(b.x) - self._col_x0, int(b.y) - top))
+                for b in blocks
+                for layer in _block_layers(int(b.w), int(b.h), b.color, theme, self._rounded)
+            ),
+        )
+
+    def _tile(self, ti: int, state: GameState, theme: Theme, W: int) -> pygame.Surface:
+        tile = self._tiles.get(ti)
+        if tile is not None:
+            self._tiles.move_to_end(ti)
+            return tile
+
+        tile = pygame.Surface((max(1, self._col_x1 - self._col_x0), TOWER_TILE_H))
+        tile.fill(TOWER_COLORKEY)
+        tile.set_colorkey(TOWER_COLORKEY)
+
+        top = ti * TOWER_TILE_H
+        blocks = state.stack_index.blocks_in_range(top - self._max_h, top + TOWER_TILE_H)
+        self._paint(tile, ti, blocks, theme)
+
+        self._tiles[ti] = tile
+        return tile
+
+    def draw(
+        self,
+        screen: pygame.Surface,
+        state: GameState,
+        theme: Theme,
+        cam_y: float,
+        W: int,
+        H: int,
+        rounded: bool = True,
+    ) -> None:
+        self._sync(state, theme, W, rounded)
+        if not state.stack:
+            return
+
+        hi_y, lo_y = state.stack_index.height_range()
+        i0 = int(max(cam_y, hi_y) // TOWER_TILE_H)
+        i1 = int(min(cam_y + H, lo_y + self._max_h) // TOWER_TILE_H)
+
+        for ti in range(i0, i1 + 1):
+            tile = self._tile(ti, state, theme, W)
+            # 타일 안 블록은 같이 floor 로 놓임 (블록별 int() 와는 화면 위로 걸친 블록만 1px 차이날 수 있음)
+            screen.blit(tile, (self._col_x0, math.floor(ti * TOWER_TILE_H - cam_y)))
+
+        keep = max(2, H // TOWER_TILE_H + 3)
+        while len(self._tiles) > keep:
+            self._tiles.popitem(last=False)
+
+
+class BackdropCache:
+    """배경/바닥/오버레이 캐시.
+
+    - 딤 오버레이는 배경/바닥 색에 미리 합성(테마별 1회) → 매 프레임 전체 화면 알파 블렌드 없음
+    - 게임오버 반투명 오버레이 surface 는 화면 크기별 1회 생성
+    """
+
+    def __init__(self) -> None:
+        self._colors: Dict[str, Tuple[Tuple[int, int, int], Tuple[int, int, int]]] = {}
+        self._overlay: Optional[pygame.Surface] = None
+        self._overlay_size: Optional[Tuple[int, int]] = None
+
+    def invalidate(self) -> None:
+        self._colors.clear()
+        self._overlay = None
+        self._overlay_size = None
+
+    def colors(self, theme: Theme, dim: bool = True) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+        if not dim:
+            return theme.bg, theme.floor
+
+        cached = self._colors.get(theme.key)
+        if cached is not None:
+            return cached
+
+        if theme.bg_dim_alpha > 0:
+            # pygame 알파 블렌드 결과와 똑같이 맞추려고 1x2 surface 로 한 번 합성
+            probe = pygame.Surface((2, 1))
+            probe.set_at((0, 0), theme.bg)
+            probe.set_at((1, 0), theme.floor)
+            dim = pygame.Surface((2, 1), pygame.SRCALPHA)
+            dim.fill((*theme.bg_dim_color, int(theme.bg_dim_alpha)))
+            probe.blit(dim, (0, 0))
+            c = probe.get_at((0, 0))
+            f = probe.get_at((1, 0))
+            cached = ((c.r, c.g, c.b), (f.r, f.g, f.b))
+        else:
+            cached = (theme.bg, theme.floor)
+
+        self._colors[theme.key] = cached
+        return cached
+
+    def game_over_overlay(self, W: int, H: int) -> pygame.Surface:
+        if self._overlay is None or self._overlay_size != (W, H):
+            ov = pygame.Surface((W, H), pygame.SRCALPHA)
+            ov.fill((255, 255, 255, 190))
+            self._overlay = ov
+            self._overlay_size = (W, H)
+        return self._overlay
+
+
+_tower = TowerLayer()
+_backdrop = BackdropCache()
+text_cache = TextCache(256)
+sprite_cache = SpriteCache(max_items=512, max_bytes=32 * 1024 * 1024)
+
+
+def invalidate_caches() -> None:
+    """F11 리사이즈 / 디스플레이 재생성 시 호출."""
+    _tower.invalidate()
+    _backdrop.invalidate()
+
+
+def _draw_lifetime_stats(screen: pygame.Surface, font: pygame.font.Font, stats: RunStats, W: int, H: int) -> None:
+    """오른쪽 아래: 누적 통계 + perfect 비율 히스토그램 (0~100%, 10칸)."""
+    s = stats.summary()
+    lines = [
+        "Lifetime:",
+        f"runs {s['runs']}  mean {s['mean']:.1f}  max {s['max']}",
+        f"p50 {s['p50']:.0f}  p90 {s['p90']:.0f}  p99 {s['p99']:.0f}",
+        f"best combo {s['best_combo']}  perfect streak {s['perfect_streak']} (best {s['best_perfect_streak']})",
+    ]
+    right = W - 18
+    y = H - 170
+    for line in lines:
+        li = text_cache.render(font, line, (35, 35, 35))
+        screen.blit(li, (right - li.get_width(), y))
+        y += 20
+
+    hist = stats.rate_hist
+    peak = max(hist) or 1
+    bar_w, gap, bar_h = 10, 3, 40
+    x = right - len(hist) * (bar_w + gap) + gap
+    base = y + 6 + bar_h
+    for c in hist:
+        h = max(1, int(bar_h * c / peak)) if c else 1
+        pygame.draw.rect(screen, (60, 60, 70), pygame.Rect(x, base - h, bar_w, h))
+        x += bar_w + gap
 
 
 def draw_game(
@@ -32,64 +284,68 @@ def draw_game(
     screen_size: Tuple[int, int],
     floor_y: float,
     theme_key: str,
+    current_pos: Optional[Tuple[float, float]] = None,
+    render_time: Optional[float] = None,
 ) -> None:
+    """current_pos / render_time: 고정 스텝 보간값 (없으면 state 그대로)"""
     W, H = screen_size
     theme = get_theme(theme_key)
+    q = get_quality(state.quality_level)
 
     # 배경/바닥
-    screen.fill(theme.bg)
+    # ✅ 배경/바닥만 살짝 딤(블록은 안 딤 → 눈부심만 줄임) — 딤은 색에 미리 합성
+    bg, floor = _backdrop.colors(theme, q.bg_dim)
+    screen.fill(bg)
     floor_screen_y = int(floor_y - cam_y)
-    pygame.draw.rect(screen, theme.floor, pygame.Rect(0, floor_screen_y, W, H - floor_screen_y))
-
-    # ✅ 배경/바닥만 살짝 딤(블록은 안 딤 → 눈부심만 줄임)
-    if theme.bg_dim_alpha > 0:
-        overlay = pygame.Surface((W, H), pygame.SRCALPHA)
-        overlay.fill((*theme.bg_dim_color, int(theme.bg_dim_alpha)))
-        screen.blit(overlay, (0, 0))
+    pygame.draw.rect(screen, floor, pygame.Rect(0, floor_screen_y, W, H - floor_screen_y))
 
     # 파티클
-    for p in state.particles:
-        pr = pygame.Rect(int(p.x), int(p.y - cam_y), int(p.size), int(p.size))
-        pygame.draw.rect(screen, p.color, pr, border_radius=2)
+    for px, py, size, color in state.particles.items():
+        py = int(py - cam_y)
+        if py > H or py + size < 0:
+            continue
+        pr = pygame.Rect(int(px), py, size, size)
+        pygame.draw.rect(screen, color, pr, border_radius=2 if q.rounded else 0)
 
     # shards
+    t = state.sim_time if render_time is None else render_time
     for s in state.shards:
-        r = pygame.Rect(int(s.x), int(s.y - cam_y), int(s.w), int(s.h))
-        pygame.draw.rect(screen, s.color, r, border_radius=6)
+        sy = int(s.y_at(t) - cam_y)
+        if sy > H or sy + s.h < 0:
+            continue
+        r = pygame.Rect(int(s.x), sy, int(s.w), int(s.h))
+        pygame.draw.rect(screen, s.color, r, border_radius=6 if q.rounded else 0)
 
-    # stack
-    for b in state.stack:
-        r = pygame.Rect(int(b.x), int(b.y - cam_y), int(b.w), int(b.h))
-        _draw_block(screen, r, b.color, theme)
+    # stack (캐시 타일, 화면에 걸친 타일만)
+    _tower.draw(screen, state, theme, cam_y, W, H, q.rounded)
 
     # current
     if state.current:
         c = state.current
-        r = pygame.Rect(int(c.x), int(c.y - cam_y), int(c.w), int(c.h))
-        _draw_block(screen, r, c.color, theme)
+        cx, cy = current_pos if current_pos is not None else (c.x, c.y)
+        pos = (int(cx), int(cy - cam_y))
+        SpriteCache.draw_all(screen, ((layer, pos) for layer in _block_layers(int(c.w), int(c.h), c.color, theme, q.rounded)))
 
     # HUD
     ui = f"HEIGHT: {state.score}     BEST: {state.best}"
-    img = font_main.render(ui, True, theme.text)
+    img = text_cache.render(font_main, ui, theme.text)
     screen.blit(img, (18, 16))
 
     hint = "CLICK/SPACE: DROP | F11: window size | B: BGM | [ ]: volume"
-    img2 = font_hint.render(hint, True, theme.text)
+    img2 = text_cache.render(font_hint, hint, theme.text)
     screen.blit(img2, (18, 46))
 
     # Flash
     if state.flash_text:
-        t = font_flash.render(state.flash_text, True, theme.text)
+        t = text_cache.render(font_flash, state.flash_text, theme.text)
         screen.blit(t, (W // 2 - t.get_width() // 2, 86))
 
     # GameOver UI
     if state.game_over:
-        ov = pygame.Surface((W, H), pygame.SRCALPHA)
-        ov.fill((255, 255, 255, 190))
-        screen.blit(ov, (0, 0))
+        screen.blit(_backdrop.game_over_overlay(W, H), (0, 0))
 
-        t1 = font_main.render(f"HEIGHT: {state.score}", True, (20, 20, 20))
-        t2 = font_main.render("ONE MORE?  (click / space)", True, (20, 20, 20))
+        t1 = text_cache.render(font_main, f"HEIGHT: {state.score}", (20, 20, 20))
+        t2 = text_cache.render(font_main, "ONE MORE?  (click / space)", (20, 20, 20))
         screen.blit(t1, (W // 2 - t1.get_width() // 2, H // 2 - 80))
         screen.blit(t2, (W // 2 - t2.get_width() // 2, H // 2 - 30))
 
@@ -97,24 +353,27 @@ def draw_game(
         s = f"Skin: {theme.display}   (LEFT/RIGHT)"
         if locked:
             s += "   [LOCKED]"
-        ts = font_hint.render(s, True, (20, 20, 20))
+        ts = text_cache.render(font_hint, s, (20, 20, 20))
         screen.blit(ts, (W // 2 - ts.get_width() // 2, H // 2 + 10))
 
         neon_ok = (state.best >= 25)
         paper_ok = (state.lifetime_perfect >= 10)
         p1 = f"Unlock Neon: BEST 25  ({'OK' if neon_ok else f'{state.best}/25'})"
         p2 = f"Unlock Paper: PERFECT 10 total  ({'OK' if paper_ok else f'{state.lifetime_perfect}/10'})"
-        u1 = font_hint.render(p1, True, (35, 35, 35))
-        u2 = font_hint.render(p2, True, (35, 35, 35))
+        u1 = text_cache.render(font_hint, p1, (35, 35, 35))
+        u2 = text_cache.render(font_hint, p2, (35, 35, 35))
         screen.blit(u1, (W // 2 - u1.get_width() // 2, H // 2 + 40))
         screen.blit(u2, (W // 2 - u2.get_width() // 2, H // 2 + 62))
 
         if state.runs:
-            title = font_hint.render("Recent Runs:", True, (35, 35, 35))
+            title = text_cache.render(font_hint, "Recent Runs:", (35, 35, 35))
             screen.blit(title, (18, H - 170))
             y = H - 145
             for r in state.runs[:5]:
                 line = f"- {r.get('score', 0)}  | perfect:{r.get('perfect', 0)}  | maxCombo:{r.get('max_combo', 0)}"
-                li = font_hint.render(line, True, (35, 35, 35))
+                li = text_cache.render(font_hint, line, (35, 35, 35))
                 screen.blit(li, (18, y))
                 y += 20
+
+        if state.run_stats.count:
+            _draw_lifetime_stats(screen, font_hint, state.run_stats, W, H)
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+"""run_journal.py
+
+런 기록 append-only 저널 (JSONL) + 오프셋 인덱스.
+- runs.jsonl: 한 줄에 런 하나, 끝에 덧붙이기만 함 → 런 하나당 O(1)
+- runs.jsonl.idx: 줄 시작 오프셋 (uint64 배열) → 최근 N개를 seek 한 번으로 읽음
+- 열 때 복구: 마지막 줄이 잘렸으면(개행 없음/JSON 깨짐) 잘라냄, 인덱스가 모자라면 뒤쪽만 다시 스캔
+- max_records 를 25% 넘기면 maybe_compact() 로 오래된 것부터 정리 (임시 파일 + os.replace)
+  append 는 두 번 쓰기만 함, 정리는 save_data 가 SaveStore 워커 스레드에서 돌림
+- compact 는 대부분을 잠금 없이 다시 쓰고, 그 사이 붙은 꼬리만 잠금 안에서 옮긴 뒤 교체
+  → 정리 중에도 append/recent 가 오래 막히지 않음
+"""
+
+import json
+import os
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+JOURNAL_MAX_RECORDS = 1_000_000
+COMPACT_SLACK = 0.25
+
+_SCAN_CHUNK = 1 << 20
+
+
+def _index_path(path: Path) -> Path:
+    return path.with_name(path.name + ".idx")
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _scan_offsets(f, start: int, end: int) -> array:
+    """[start, end) 안의 줄 시작 오프셋 (start 는 줄 시작이라고 가정)."""
+    out = array("Q")
+    pos = start
+    f.seek(start)
+    line_start = start
+    while pos < end:
+        chunk = f.read(min(_SCAN_CHUNK, end - pos))
+        if not chunk:
+            break
+        i = chunk.find(b"\n")
+        while i != -1:
+            out.append(line_start)
+            line_start = pos + i + 1
+            i = chunk.find(b"\n", i + 1)
+        pos += len(chunk)
+    return out
+
+
+class RunJournal:
+    def __init__(self, path: Path, max_records: Optional[int] = JOURNAL_MAX_RECORDS) -> None:
+        self.path = Path(path)
+        self.index_path = _index_path(self.path)
+        self.max_records = max_records
+        self.recovered_bytes = 0  # 열 때 잘라낸 깨진 꼬리 크기
+
+        self._offsets = array("Q")
+        self._size = 0
+        self._index_dirty = False
+        self._f = None
+        self._idx = None
+        self._lock = threading.RLock()  # append/읽기 vs 워커 스레드 compact
+        self._compacting = False
+        self._open()
+
+    # ---- open / recovery ----
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+
+        with open(self.path, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            size = self._truncate_torn_tail(f, size)
+            offsets = self._load_index(f, size)
+            offsets = self._drop_bad_last(f, offsets, size)
+            size = f.seek(0, os.SEEK_END)
+
+        self._offsets = offsets
+        self._size = size
+        if self._index_dirty:
+            self._write_index_file(offsets)
+            self._index_dirty = False
+
+        self._f = open(self.path, "ab")
+        self._idx = open(self.index_path, "ab")
+
+    def _truncate_torn_tail(self, f, size: int) -> int:
+        """개행으로 안 끝나면 마지막 개행 뒤를 잘라냄."""
+        if size == 0:
+            return 0
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return size
+
+        pos = size
+        keep = 0
+        while pos > 0:
+            step = min(_SCAN_CHUNK, pos)
+            pos -= step
+            f.seek(pos)
+            i = f.read(step).rfind(b"\n")
+            if i != -1:
+                keep = pos + i + 1
+                break
+        f.truncate(keep)
+        self.recovered_bytes += size - keep
+        return keep
+
+    def _load_index(self, f, size: int) -> array:
+        offsets = array("Q")
+        try:
+            raw = self.index_path.read_bytes()
+            if len(raw) % offsets.itemsize:
+                raw = raw[: len(raw) - len(raw) % offsets.itemsize]
+                self._index_dirty = True
+            offsets.frombytes(raw)
+        except OSError:
+            self._index_dirty = True
+
+        # 저널보다 앞서 나간 항목(잘라낸 꼬리) 제거
+        n = len(offsets)
+        while n and offsets[n - 1] >= size:
+            n -= 1
+        if n < len(offsets):
+            del offsets[n:]
+            self._index_dirty = True
+
+        # 마지막 오프셋이 줄 시작이 아니면 인덱스를 믿을 수 없음 → 전체 재구축
+        if offsets and offsets[-1] > 0:
+            f.seek(offsets[-1] - 1)
+            if f.read(1) != b"\n":
+                offsets = array("Q")
+                self._index_dirty = True
+
+        # 인덱스 기록 전에 죽었으면 저널 뒤쪽만 스캔해서 보충
+        if offsets:
+            f.seek(offsets[-1])
+            f.readline()
+            tail = f.tell()
+        else:
+            tail = 0
+        missing = _scan_offsets(f, tail, size)
+        if missing:
+            offsets.extend(missing)
+            self._index_dirty = True
+        return offsets
+
+    def _drop_bad_last(self, f, offsets: array, size: int) -> array:
+        """개행은 있는데 JSON 이 깨진 마지막 줄 제거."""
+        while offsets:
+            last = offsets[-1]
+            f.seek(last)
+            line = f.read(size - last)
+            try:
+                json.loads(line)
+                break
+            except ValueError:
+                f.truncate(last)
+                self.recovered_bytes += size - last
+                self._index_dirty = True
+                size = last
+                offsets.pop()
+        return offsets
+
+    def _write_index_file(self, offsets: array) -> None:
+        tmp = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            offsets.tofile(f)
+        os.replace(tmp, self.index_path)
+
+    # ---- public ----
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        data = _encode(record)
+        with self._lock:
+            self._f.write(data)
+            self._f.flush()
+            off = array("Q", [self._size])
+            self._idx.write(off.tobytes())
+            self._idx.flush()
+            self._offsets.append(self._size)
+            self._size += len(data)
+
+    def extend(self, records: Sequence[Dict[str, Any]]) -> None:
+        for r in records:
+            self.append(r)
+
+    def _read_span(
+        self,
+        i0: int,
+        i1: int,
+        offsets: Optional[array] = None,
+        size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """i0 ~ i1-1 번째 레코드 (오래된 것 먼저). offsets/size 를 주면 그 스냅샷 기준."""
+        if offsets is None:
+            with self._lock:
+                offsets, size = self._offsets, self._size
+                return self._read_span(i0, i1, offsets, size)
+        if i0 >= i1:
+            return []
+        start = offsets[i0]
+        end = offsets[i1] if i1 < len(offsets) else size
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            raw = f.read(end - start)
+
+        out: List[Dict[str, Any]] = []
+        for line in raw.splitlines():
+            try:
+                r = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(r, dict):
+                out.append(r)
+        return out
+
+    def recent(self, n: int) -> List[Dict[str, Any]]:
+        """최근 n 개, 최신 먼저."""
+        with self._lock:
+            total = len(self._offsets)
+            runs = self._read_span(max(0, total - max(0, int(n))), total)
+        runs.reverse()
+        return runs
+
+    def get(self, i: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            total = len(self._offsets)
+            if i < 0:
+                i += total
+            if not 0 <= i < total:
+                raise IndexError(i)
+            span = self._read_span(i, i + 1)
+        return span[0] if span else None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """오래된 것부터 전체 (청크 단위로 읽음)."""
+        step = 4096
+        i = 0
+        while True:
+            with self._lock:
+                if i >= len(self._offsets):
+                    return
+                span = self._read_span(i, min(len(self._offsets), i + step))
+            yield from span
+            i += step
+
+    @property
+    def needs_compact(self) -> bool:
+        return self.max_records is not None and len(self._offsets) > self.max_records * (1.0 + COMPACT_SLACK)
+
+    def maybe_compact(self) -> int:
+        """max_records 를 25% 넘겼을 때만 compact. 지운 개수 반환."""
+        if not self.needs_compact:
+            return 0
+        return self.compact(self.max_records)
+
+    def compact(self, keep: Optional[int] = None) -> int:
+        """최근 keep 개만 남기고 다시 씀. 지운 개수 반환. (다른 스레드에서 불러도 됨)"""
+        with self._lock:
+            if self._compacting or self._f is None:
+                return 0
+            self._compacting = True
+            offsets = array("Q", self._offsets)
+            size = self._size
+
+        try:
+            total = len(offsets)
+            keep = total if keep is None else max(0, min(int(keep), total))
+            drop = total - keep
+
+            # 1) 스냅샷까지는 잠금 없이 (파일은 덧붙기만 하므로 스냅샷 범위는 안 바뀜)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            new_offsets = array("Q")
+            pos = 0
+            out = open(tmp, "wb")
+            try:
+                for i in range(drop, total, 4096):
+                    for r in self._read_span(i, min(total, i + 4096), offsets, size):
+                        data = _encode(r)
+                        out.write(data)
+                        new_offsets.append(pos)
+                        pos += len(data)
+            except BaseException:
+                out.close()
+                raise
+
+            with self._lock:
+                if self._f is None:
+                    # 정리 도중 close() 됨 → 버림
+                    out.close()
+                    try:
+                        tmp.unlink()
+                    except OSError:
+                        pass
+                    return 0
+                # 2) 그 사이 붙은 꼬리는 바이트 그대로 옮기고 교체
+                try:
+                    if len(self._offsets) > total:
+                        with open(self.path, "rb") as f:
+                            f.seek(size)
+                            tail = f.read(self._size - size)
+                        out.write(tail)
+                        for off in self._offsets[total:]:
+                            new_offsets.append(pos + off - size)
+                        pos += len(tail)
+                    out.flush()
+                    os.fsync(out.fileno())
+                finally:
+                    out.close()
+
+                self._f.close()
+                self._idx.close()
+                try:
+                    # 인덱스를 먼저 지움 → 중간에 죽어도 다음 open 에서 전체 재구축
+                    try:
+                        self.index_path.unlink()
+                    except FileNotFoundError:
+                        pass
+                    os.replace(tmp, self.path)
+                    self._write_index_file(new_offsets)
+                    self._offsets = new_offsets
+                    self._size = pos
+                finally:
+                    self._f = open(self.path, "ab")
+                    self._idx = open(self.index_path, "ab")
+            return drop
+        finally:
+            with self._lock:
+                self._compacting = False
+
+    def close(self) -> None:
+        with self._lock:
+            for f in (self._f, self._idx):
+                if f is not None:
+                    try:
+                        f.close()
+                    except Exception:
+                        pass
+            self._f = None
+            self._idx = None
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+"""run_stats.py
+
+전체 런 누적 통계 (런 하나당 O(1) 갱신, 기록 전체를 다시 안 훑음).
+- 점수 평균/표준편차: Welford
+- 점수 p50/p90/p99: 로그 버킷 스케치 (DDSketch 방식, 상대오차 1%, merge 가능)
+- perfect 비율(perfect / score) 히스토그램 10칸
+- 최고 콤보, PERFECT 가 한 번이라도 나온 런 연속 기록(현재/최고)
+- to_dict/from_dict 로 save_data 에 저장, merge 로 여러 기기 합산
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+SKETCH_ALPHA = 0.01
+RATE_BINS = 10
+
+
+class LogSketch:
+    """상대오차 alpha 분위수 스케치. 양수는 log_gamma 버킷, 0 이하는 zero 카운트."""
+
+    def __init__(self, alpha: float = SKETCH_ALPHA) -> None:
+        self.alpha = float(alpha)
+        self.gamma = (1.0 + self.alpha) / (1.0 - self.alpha)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero = 0
+        self.count = 0
+
+    def add(self, v: float, n: int = 1) -> None:
+        if v <= 0.0:
+            self.zero += n
+        else:
+            k = math.ceil(math.log(v) / self._log_gamma)
+            self.buckets[k] = self.buckets.get(k, 0) + n
+        self.count += n
+
+    def merge(self, other: LogSketch) -> None:
+        if abs(other.alpha - self.alpha) > 1e-12:
+            raise ValueError("cannot merge sketches with different alpha")
+        for k, c in other.buckets.items():
+            self.buckets[k] = self.buckets.get(k, 0) + c
+        self.zero += other.zero
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self.zero
+        if rank < seen:
+            return 0.0
+        for k in sorted(self.buckets):
+            seen += self.buckets[k]
+            if rank < seen:
+                # 버킷 (gamma^(k-1), gamma^k] 의 대표값
+                return 2.0 * self.gamma ** k / (self.gamma + 1.0)
+        return 2.0 * self.gamma ** max(self.buckets) / (self.gamma + 1.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "alpha": self.alpha,
+            "zero": self.zero,
+            "buckets": {str(k): c for k, c in self.buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> LogSketch:
+        s = cls(float(d.get("alpha", SKETCH_ALPHA)))
+        s.zero = int(d.get("zero", 0))
+        s.buckets = {int(k): int(c) for k, c in dict(d.get("buckets", {})).items()}
+        s.count = s.zero + sum(s.buckets.values())
+        return s
+
+
+@dataclass
+class RunStats:
+    count: int = 0
+    score_mean: float = 0.0
+    score_m2: float = 0.0       # Welford 제곱합
+    score_max: int = 0
+    perfect_total: int = 0
+    best_combo: int = 0
+    perfect_streak: int = 0     # PERFECT 있는 런 연속 (현재)
+    best_perfect_streak: int = 0
+    rate_hist: List[int] = field(default_factory=lambda: [0] * RATE_BINS)
+    sketch: LogSketch = field(default_factory=LogSketch)
+
+    _summary: Optional[Dict[str, float]] = field(default=None, repr=False, compare=False)
+
+    def add_run(self, record: Dict[str, Any]) -> None:
+        try:
+            score = max(0, int(record.get("score", 0)))
+            perfect = max(0, int(record.get("perfect", 0)))
+            combo = max(0, int(record.get("max_combo", 0)))
+        except (TypeError, ValueError):
+            return
+
+        self.count += 1
+        d = score - self.score_mean
+        self.score_mean += d / self.count
+        self.score_m2 += d * (score - self.score_mean)
+        self.score_max = max(self.score_max, score)
+        self.sketch.add(score)
+
+        self.perfect_total += perfect
+        self.best_combo = max(self.best_combo, combo)
+        if perfect > 0:
+            self.perfect_streak += 1
+            self.best_perfect_streak = max(self.best_perfect_streak, self.perfect_streak)
+        else:
+            self.perfect_streak = 0
+
+        rate = perfect / score if score > 0 else 0.0
+        self.rate_hist[min(RATE_BINS - 1, int(rate * RATE_BINS))] += 1
+        self._summary = None
+
+    def merge(self, other: RunStats) -> None:
+        """다른 기기/기간 통계 합산 (연속 기록은 최고값만 의미 있음)."""
+        if other.count == 0:
+            return
+        n = self.count + other.count
+        d = other.score_mean - self.score_mean
+        self.score_m2 += other.score_m2 + d * d * self.count * other.count / n
+        self.score_mean += d * other.count / n
+        self.count = n
+        self.score_max = max(self.score_max, other.score_max)
+        self.perfect_total += other.perfect_total
+        self.best_combo = max(self.best_combo, other.best_combo)
+        self.best_perfect_streak = max(self.best_perfect_streak, other.best_perfect_streak)
+        self.rate_hist = [a + b for a, b in zip(self.rate_hist, other.rate_hist)]
+        self.sketch.merge(other.sketch)
+        self._summary = None
+
+    def summary(self) -> Dict[str, float]:
+        """화면/대시보드용 값 (다음 add_run 전까지 캐시)."""
+        if self._summary is None:
+            var = self.score_m2 / (self.count - 1) if self.count > 1 else 0.0
+            self._summary = {
+                "runs": self.count,
+                "mean": self.score_mean,
+                "stdev": math.sqrt(max(0.0, var)),
+                "p50": self.sketch.quantile(0.50),
+                "p90": self.sketch.quantile(0.90),
+                "p99": self.sketch.quantile(0.99),
+                "max": self.score_max,
+                "perfect_total": self.perfect_total,
+                "best_combo": self.best_combo,
+                "perfect_streak": self.perfect_streak,
+                "best_perfect_streak": self.best_perfect_streak,
+            }
+        return self._summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "score_mean": self.score_mean,
+            "score_m2": self.score_m2,
+            "score_max": self.score_max,
+            "perfect_total": self.perfect_total,
+            "best_combo": self.best_combo,
+            "perfect_streak": self.perfect_streak,
+            "best_perfect_streak": self.best_perfect_streak,
+            "rate_hist": list(self.rate_hist),
+            "sketch": self.sketch.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> RunStats:
+        hist = [int(v) for v in d.get("rate_hist", [])][:RATE_BINS]
+        hist += [0] * (RATE_BINS - len(hist))
+        return cls(
+            count=int(d.get("count", 0)),
+            score_mean=float(d.get("score_mean", 0.0)),
+            score_m2=float(d.get("score_m2", 0.0)),
+            score_max=int(d.get("score_max", 0)),
+            perfect_total=int(d.get("perfect_total", 0)),
+            best_combo=int(d.get("best_combo", 0)),
+            perfect_streak=int(d.get("perfect_streak", 0)),
+            best_perfect_streak=int(d.get("best_perfect_streak", 0)),
+            rate_hist=hist,
+            sketch=LogSketch.from_dict(d.get("sketch", {})),
+        )
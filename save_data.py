@@ -8,52 +8,230 @@ save_data.json 하나에 통합 저장.
 - bgm_on, bgm_volume
 - selected_theme, unlocked_themes
 - lifetime_perfect
-- runs (최근 30개)
+- runs → runs.jsonl 저널로 이전 (run_journal.py, 전체 기록 보관)
+- run_stats (run_stats.py 누적 통계)
+
+SaveStore:
+- 파일은 처음 한 번만 읽고 이후엔 메모리 dict 만 읽고 씀
+- 바뀐 게 있으면 debounce 동안 모았다가 워커 스레드가 한 번에 기록 (프레임은 디스크를 안 기다림)
+- 기록은 임시 파일에 쓰고 os.replace → 중간에 죽어도 파일이 잘린 채로 남지 않음
+- 종료 시 close() 로 남은 변경 flush
+- submit(fn): 오래 걸리는 정리 작업(저널 compact)도 같은 워커 스레드에서
 """
 
+import atexit
 import json
+import os
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from run_journal import RunJournal
+from run_stats import RunStats
 
 SAVE_PATH = Path("save_data.json")
+RUNS_FILE = "runs.jsonl"  # SAVE_PATH 옆에 둠
+SAVE_DEBOUNCE = 0.5  # 초
 
 
-def _safe_read() -> Dict[str, Any]:
+def _safe_read(path: Path) -> Dict[str, Any]:
     try:
-        if not SAVE_PATH.exists():
+        if not path.exists():
             return {}
-        data = json.loads(SAVE_PATH.read_text(encoding="utf-8"))
+        data = json.loads(path.read_text(encoding="utf-8"))
         return data if isinstance(data, dict) else {}
     except Exception:
         return {}
 
 
-def _safe_write(data: Dict[str, Any]) -> None:
-    try:
-        SAVE_PATH.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-    except Exception:
-        pass
+def _atomic_write(path: Path, text: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class SaveStore:
+    def __init__(self, path: Path, debounce: float = SAVE_DEBOUNCE) -> None:
+        self.path = Path(path)
+        self.debounce = max(0.0, float(debounce))
+        self.writes = 0
+
+        self._data: Dict[str, Any] = _safe_read(self.path)
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._io_lock = threading.Lock()  # 기록 순서 보장 (워커 vs flush)
+
+        self._dirty = False      # 파일과 메모리가 다름
+        self._pending = False    # 워커가 기록해야 함
+        self._last_change = 0.0
+        self._closing = False
+        self._worker: Optional[threading.Thread] = None
+        self._tasks: List[Callable[[], Any]] = []
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        self.update({key: value})
+
+    def update(self, values: Dict[str, Any]) -> None:
+        with self._cond:
+            changed = False
+            for k, v in values.items():
+                if k not in self._data or self._data[k] != v:
+                    self._data[k] = v
+                    changed = True
+            if changed:
+                self._mark_dirty()
+
+    def delete(self, key: str) -> None:
+        with self._cond:
+            if key in self._data:
+                del self._data[key]
+                self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        # self._cond 잡은 상태에서 호출
+        self._dirty = True
+        self._last_change = time.monotonic()
+        if self._closing:
+            return
+        self._pending = True
+        self._wake_worker()
+
+    def _wake_worker(self) -> None:
+        # self._cond 잡은 상태에서 호출
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="save-store", daemon=True)
+            self._worker.start()
+        self._cond.notify()
+
+    def submit(self, fn: Callable[[], Any]) -> None:
+        """fn 을 워커 스레드에서 실행 (예외는 무시). 종료 중이면 버림."""
+        with self._cond:
+            if self._closing:
+                return
+            self._tasks.append(fn)
+            self._wake_worker()
+
+    def flush(self) -> bool:
+        """남은 변경을 지금 (호출 스레드에서) 기록. 실패하면 False."""
+        with self._io_lock:
+            with self._lock:
+                if not self._dirty:
+                    return True
+                text = json.dumps(self._data, ensure_ascii=False, indent=2)
+                self._dirty = False
+                self._pending = False
+            try:
+                _atomic_write(self.path, text)
+                self.writes += 1
+                return True
+            except Exception:
+                # 다음 변경/flush 때 다시 시도
+                with self._lock:
+                    self._dirty = True
+                return False
+
+    def close(self) -> None:
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+            worker = self._worker
+        if worker is not None:
+            worker.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._tasks and not self._closing:
+                    self._cond.wait()
+                # 마지막 변경 후 debounce 만큼 조용해질 때까지 모음
+                while self._pending and not self._closing:
+                    remaining = self._last_change + self.debounce - time.monotonic()
+                    if remaining <= 0.0:
+                        break
+                    self._cond.wait(remaining)
+                if self._closing:
+                    return  # 마지막 기록은 close() 가 함
+                tasks, self._tasks = self._tasks, []
+            self.flush()
+            for fn in tasks:
+                try:
+                    fn()
+                except Exception:
+                    pass
+
+
+_store: Optional[SaveStore] = None
+_journal: Optional[RunJournal] = None
+
+
+def get_store() -> SaveStore:
+    """SAVE_PATH 의 SaveStore (경로가 바뀌면 이전 것을 닫고 새로 염)."""
+    global _store
+    if _store is None or _store.path != Path(SAVE_PATH):
+        close_store()
+        _store = SaveStore(SAVE_PATH)
+    return _store
+
+
+def get_journal() -> RunJournal:
+    """SAVE_PATH 옆 runs.jsonl 저널. 예전 save_data.json 의 runs 배열은 처음 열 때 옮김."""
+    global _journal
+    store = get_store()
+    path = Path(SAVE_PATH).with_name(RUNS_FILE)
+    if _journal is None or _journal.path != path:
+        if _journal is not None:
+            _journal.close()
+        _journal = RunJournal(path)
+
+        legacy = store.get("runs")
+        if isinstance(legacy, list):
+            if len(_journal) == 0:
+                # 배열은 최신 먼저 → 저널엔 오래된 것부터
+                _journal.extend([r for r in reversed(legacy) if isinstance(r, dict)])
+            store.delete("runs")
+    return _journal
+
+
+def close_store() -> None:
+    """종료 시 호출: 남은 변경 기록 + 워커/저널 정리."""
+    global _store, _journal
+    # 워커(저널 compact 포함)를 먼저 끝내고 저널을 닫음
+    if _store is not None:
+        _store.close()
+        _store = None
+    if _journal is not None:
+        _journal.close()
+        _journal = None
+
+
+atexit.register(close_store)
 
 
 def load_best(default: int = 0) -> int:
-    data = _safe_read()
     try:
-        return int(data.get("best", default))
+        return int(get_store().get("best", default))
     except Exception:
         return int(default)
 
 
 def save_best(best: int) -> None:
-    data = _safe_read()
-    data["best"] = int(best)
-    _safe_write(data)
+    get_store().set("best", int(best))
 
 
 def load_bgm_settings(default_on: bool, default_volume: float) -> Tuple[bool, float]:
-    data = _safe_read()
-    on = bool(data.get("bgm_on", default_on))
+    store = get_store()
+    on = bool(store.get("bgm_on", default_on))
     try:
-        vol = float(data.get("bgm_volume", default_volume))
+        vol = float(store.get("bgm_volume", default_volume))
     except Exception:
         vol = float(default_volume)
     vol = 0.0 if vol < 0.0 else 1.0 if vol > 1.0 else vol
@@ -61,29 +239,24 @@ def load_bgm_settings(default_on: bool, default_volume: float) -> Tuple[bool, fl
 
 
 def save_bgm_settings(on: bool, volume: float) -> None:
-    data = _safe_read()
-    data["bgm_on"] = bool(on)
     v = float(volume)
     v = 0.0 if v < 0.0 else 1.0 if v > 1.0 else v
-    data["bgm_volume"] = v
-    _safe_write(data)
+    get_store().update({"bgm_on": bool(on), "bgm_volume": v})
 
 
 def load_theme_settings(default_selected: str = "sky") -> Tuple[str, List[str]]:
-    data = _safe_read()
-    selected = str(data.get("selected_theme", default_selected))
-    unlocked = data.get("unlocked_themes", ["sky"])
+    store = get_store()
+    selected = str(store.get("selected_theme", default_selected))
+    unlocked = store.get("unlocked_themes", ["sky"])
     if not isinstance(unlocked, list):
         unlocked = ["sky"]
+    unlocked = list(unlocked)
     if "sky" not in unlocked:
         unlocked.insert(0, "sky")
     return selected, unlocked
 
 
 def save_theme_settings(selected: str, unlocked: List[str]) -> None:
-    data = _safe_read()
-    data["selected_theme"] = str(selected)
-
     u: List[str] = []
     for k in unlocked:
         if k not in u:
@@ -91,36 +264,58 @@ def save_theme_settings(selected: str, unlocked: List[str]) -> None:
     if "sky" not in u:
         u.insert(0, "sky")
 
-    data["unlocked_themes"] = u
-    _safe_write(data)
+    get_store().update({"selected_theme": str(selected), "unlocked_themes": u})
 
 
 def load_lifetime_perfect(default: int = 0) -> int:
-    data = _safe_read()
     try:
-        return int(data.get("lifetime_perfect", default))
+        return int(get_store().get("lifetime_perfect", default))
     except Exception:
         return int(default)
 
 
 def save_lifetime_perfect(v: int) -> None:
-    data = _safe_read()
-    data["lifetime_perfect"] = int(max(0, v))
-    _safe_write(data)
+    get_store().set("lifetime_perfect", int(max(0, v)))
 
 
-def load_runs() -> List[Dict[str, Any]]:
-    data = _safe_read()
-    runs = data.get("runs", [])
-    return runs if isinstance(runs, list) else []
+def load_runs(limit: int = 30) -> List[Dict[str, Any]]:
+    """최근 limit 개 (최신 먼저)."""
+    try:
+        return get_journal().recent(limit)
+    except Exception:
+        return []
 
 
 def append_run(record: Dict[str, Any], limit: int = 30) -> None:
-    data = _safe_read()
-    runs = data.get("runs", [])
-    if not isinstance(runs, list):
-        runs = []
-    runs.insert(0, record)
-    runs = runs[: max(1, int(limit))]
-    data["runs"] = runs
-    _safe_write(data)
+    """저널 끝에 한 줄 추가 (기록은 자르지 않음, limit 은 예전 호출 호환용)."""
+    try:
+        journal = get_journal()
+        journal.append(record)
+        if journal.needs_compact:
+            # 오래된 기록 정리는 워커 스레드에서 (프레임 안 멈춤)
+            get_store().submit(journal.maybe_compact)
+    except Exception:
+        pass
+
+
+def load_run_stats() -> RunStats:
+    """저장된 누적 통계. 없으면 저널 전체로 한 번 만들어 저장."""
+    data = get_store().get("run_stats")
+    if isinstance(data, dict):
+        try:
+            return RunStats.from_dict(data)
+        except Exception:
+            pass
+
+    stats = RunStats()
+    try:
+        for r in get_journal():
+            stats.add_run(r)
+    except Exception:
+        pass
+    save_run_stats(stats)
+    return stats
+
+
+def save_run_stats(stats: RunStats) -> None:
+    get_store().set("run_stats", stats.to_dict())
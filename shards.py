@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+"""shards.py
+
+잘려 나간 조각(shard) 관리.
+- shard 는 등가속 낙하라 (생성 시각, 초기 y, 초기 vy) 만 저장하고 그릴 때 y(t) 계산
+- 화면/바닥 아래로 빠지는 시각을 생성 시 구해 min-heap 에 넣고 O(log n) 만료
+- 프레임마다 하는 shard 적분 없음, 결과가 dt 와 무관
+"""
+
+import heapq
+import math
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    from models import BlockShard
+
+
+def exit_time(s: BlockShard, y_limit: float) -> float:
+    """s 의 y 가 y_limit 를 넘는 시각."""
+    dy = y_limit - s.y
+    if dy <= 0.0:
+        return s.t0
+    g = s.gravity
+    if g <= 0.0:
+        return s.t0 + dy / s.vy if s.vy > 0.0 else math.inf
+    return s.t0 + (-s.vy + math.sqrt(s.vy * s.vy + 2.0 * g * dy)) / g
+
+
+class ShardSet:
+    def __init__(self) -> None:
+        self._live: Dict[int, BlockShard] = {}
+        self._heap: List[Tuple[float, int]] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __bool__(self) -> bool:
+        return bool(self._live)
+
+    def __iter__(self) -> Iterator[BlockShard]:
+        return iter(self._live.values())
+
+    def clear(self) -> None:
+        self._live.clear()
+        self._heap.clear()
+
+    def add(self, s: BlockShard, y_limit: float) -> None:
+        self._seq += 1
+        self._live[self._seq] = s
+        heapq.heappush(self._heap, (exit_time(s, y_limit), self._seq))
+
+    def expire(self, now: float) -> int:
+        heap = self._heap
+        n = 0
+        while heap and heap[0][0] <= now:
+            _, seq = heapq.heappop(heap)
+            self._live.pop(seq, None)
+            n += 1
+        return n
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+"""simulator.py
+
+헤드리스 시뮬레이터.
+- display/mixer/clock 없이 update_game / reset_run / update_effects 를 그대로 돌림
+- 드랍 스케줄(블록별 대기 시간) 또는 policy 콜백으로 드랍 결정
+- 밸런싱/회귀 체크용
+- 게임 코드(spawner/utils)가 전역 random 을 쓰므로 reset(seed) 는 전역 random 과 FX_RNG 를 다시 시드함
+  run(seed=...) 은 끝나면 두 난수 상태를 호출 전으로 되돌림 → 같은 프로세스의 다른 코드 random 흐름 유지
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import config
+from effects import update_effects, update_flash
+from particles import FX_RNG, seed_fx
+from mechanics import begin_drop, get_top_block, top_surface_y
+from models import GameState
+from spawner import reset_run
+from update import update_game
+
+# policy(state) -> True 면 이번 스텝에 드랍
+Policy = Callable[[GameState], bool]
+
+
+@dataclass
+class RunResult:
+    seed: Optional[int]
+    score: int
+    perfect: int
+    max_combo: int
+    steps: int
+    sim_time: float
+    game_over: bool
+
+
+def aligned_policy(tolerance: float = 6.0) -> Policy:
+    """현재 블록 중심이 top 블록 중심에 tolerance 이내로 오면 드랍."""
+    def _policy(state: GameState) -> bool:
+        top = get_top_block(state)
+        cur = state.current
+        if top is None or cur is None:
+            return False
+        return abs((cur.x + cur.w * 0.5) - (top.x + top.w * 0.5)) <= tolerance
+
+    return _policy
+
+
+def random_policy(drop_rate: float = 1.5, dt: float = 1.0 / config.SIM_HZ) -> Policy:
+    """초당 drop_rate 회 꼴로 무작위 드랍(전역 random 사용 → seed 로 재현 가능)."""
+    p = max(0.0, min(1.0, drop_rate * dt))
+
+    def _policy(state: GameState) -> bool:
+        return random.random() < p
+
+    return _policy
+
+
+POLICIES: Dict[str, Callable[[], Policy]] = {
+    "aligned": lambda: aligned_policy(6.0),
+    "sloppy": lambda: aligned_policy(40.0),
+    "random": lambda: random_policy(1.5),
+}
+
+
+class Simulator:
+    """GameState 하나를 소유하고 고정 dt 로 메카닉을 스텝."""
+
+    def __init__(
+        self,
+        screen_size: Tuple[int, int] = (config.WINDOW_W, config.WINDOW_H),
+        dt: float = 1.0 / config.SIM_HZ,
+        fast_drop: bool = True,
+        max_hold: float = 4.0,
+    ) -> None:
+        self.W, self.H = screen_size
+        self.floor_y = self.H - config.FLOOR_MARGIN
+        self.dt = float(dt)
+        # drop 단계는 x 가 고정이라 착지 결과가 낙하 시간과 무관 → 한 스텝으로 착지
+        self.fast_drop = fast_drop
+        # policy 가 끝내 드랍하지 않는 경우 강제 드랍(무한 루프 방지)
+        self.max_hold = float(max_hold)
+
+        self.state = GameState()
+        self.seed: Optional[int] = None
+        self.steps = 0
+        self.sim_time = 0.0
+        self._hold = 0.0
+
+    def reset(self, seed: Optional[int] = None) -> GameState:
+        """seed 가 있으면 전역 random / FX_RNG 를 그 seed 로 다시 시드 (되돌리지 않음, run() 은 되돌림)."""
+        self.seed = seed
+        if seed is not None:
+            random.seed(seed)
+            seed_fx(seed)
+
+        self.steps = 0
+        self.sim_time = 0.0
+        self._hold = 0.0
+        reset_run(
+            self.state,
+            screen_w=self.W,
+            floor_y=self.floor_y,
+            hover_y=config.HOVER_Y,
+            block_h=config.BLOCK_H,
+            edge_padding=config.EDGE_PADDING,
+            horizontal_speed=config.HORIZONTAL_SPEED,
+        )
+        return self.state
+
+    def drop(self) -> None:
+        begin_drop(self.state)
+
+    def step(self, dt: Optional[float] = None) -> None:
+        state = self.state
+        dt = self.dt if dt is None else float(dt)
+
+        cur = state.current
+        if self.fast_drop and cur is not None and cur.phase == "drop" and not state.game_over:
+            land_y = top_surface_y(state, self.floor_y) - cur.h
+            dt = max(dt, (land_y - cur.y) / config.FALL_SPEED)
+
+        update_effects(state, dt)
+        update_flash(state, dt)
+        update_game(
+            state,
+            dt=dt,
+            screen_w=self.W,
+            floor_y=self.floor_y,
+            hover_y=config.HOVER_Y,
+            block_h=config.BLOCK_H,
+            fall_speed=config.FALL_SPEED,
+            horizontal_speed=config.HORIZONTAL_SPEED,
+            edge_padding=config.EDGE_PADDING,
+            min_overlap_ratio=config.MIN_OVERLAP_RATIO,
+            perfect_ratio=config.PERFECT_RATIO,
+            flash_time=config.FLASH_TIME,
+            combo_every=config.COMBO_REWARD_EVERY,
+            combo_bonus=config.COMBO_WIDTH_BONUS,
+            shard_gravity=config.SHARD_GRAVITY,
+            shard_fall_speed=config.SHARD_FALL_SPEED,
+        )
+        self.steps += 1
+        self.sim_time += dt
+
+    def run(
+        self,
+        policy: Optional[Policy] = None,
+        schedule: Optional[Sequence[float]] = None,
+        seed: Optional[int] = None,
+        max_blocks: Optional[int] = None,
+        max_steps: int = 1_000_000,
+    ) -> RunResult:
+        """한 판을 끝까지(game over / max_blocks / 스케줄 소진) 돌린다.
+
+        schedule: 블록마다 move 단계에서 기다릴 시간(초). 다 쓰면 종료.
+        policy: 매 스텝 호출, True 면 드랍. schedule 이 있으면 무시.
+        seed: 있으면 그 seed 로 재현 가능, 전역 random 상태는 끝나고 원래대로.
+              None 이면 전역 random 을 그대로 이어서 씀.
+        """
+        if policy is None and schedule is None:
+            policy = aligned_policy()
+
+        if seed is None:
+            return self._run(policy, schedule, seed, max_blocks, max_steps)
+
+        saved = (random.getstate(), FX_RNG.getstate())
+        try:
+            return self._run(policy, schedule, seed, max_blocks, max_steps)
+        finally:
+            random.setstate(saved[0])
+            FX_RNG.setstate(saved[1])
+
+    def _run(
+        self,
+        policy: Optional[Policy],
+        schedule: Optional[Sequence[float]],
+        seed: Optional[int],
+        max_blocks: Optional[int],
+        max_steps: int,
+    ) -> RunResult:
+        state = self.reset(seed)
+        block_i = 0
+
+        while not state.game_over and self.steps < max_steps:
+            if max_blocks is not None and state.score >= max_blocks:
+                break
+
+            cur = state.current
+            if cur is not None and cur.phase == "move":
+                if schedule is not None:
+                    if block_i >= len(schedule):
+                        break
+                    want = self._hold >= schedule[block_i]
+                else:
+                    want = policy(state)
+
+                if want or self._hold >= self.max_hold:
+                    self.drop()
+                    self._hold = 0.0
+                    block_i += 1
+                else:
+                    self._hold += self.dt
+
+            self.step()
+
+        return RunResult(
+            seed=seed,
+            score=state.score,
+            perfect=state.run_total_perfect,
+            max_combo=state.run_max_combo,
+            steps=self.steps,
+            sim_time=self.sim_time,
+            game_over=state.game_over,
+        )
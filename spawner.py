@@ -13,8 +13,8 @@ def spawn_first_block(state: GameState, screen_w: int, floor_y: float, block_h:
 
     base = Block(x=x, y=y, w=w, h=block_h, color=pastel_color(), phase="settled")
 
-    state.stack.clear()
-    state.stack.append(base)
+    state.clear_stack()
+    state.push_block(base)
 
     state.score = 0
     state.current = None
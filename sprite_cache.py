@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+"""sprite_cache.py
+
+미리 그린 블록 sprite LRU 캐시.
+- key: (w, h, theme key, 둥근 모서리, 레이어) — 모양만, 색은 render 에서 흰 마스크에 곱함
+  (블록 색이 런마다 무작위라 색을 키에 넣으면 재사용이 거의 없음)
+- 개수/바이트 한도를 넘으면 오래 안 쓴 것부터 제거
+- 그리기는 Surface.blits 한 번으로 묶어서
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Tuple
+import pygame
+
+SpriteKey = Tuple[int, int, str, bool, str]
+
+
+class SpriteCache:
+    def __init__(self, max_items: int = 512, max_bytes: int = 32 * 1024 * 1024) -> None:
+        self.max_items = max(1, int(max_items))
+        self.max_bytes = max(1, int(max_bytes))
+        self._items: "OrderedDict[SpriteKey, pygame.Surface]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._bytes = 0
+
+    def get(
+        self,
+        key: SpriteKey,
+        paint: Callable[[pygame.Surface, pygame.Rect], None],
+    ) -> pygame.Surface:
+        """key 의 sprite 반환, 없으면 paint(surface, rect) 로 만들어 넣음."""
+        surf = self._items.get(key)
+        if surf is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        w, h = max(1, key[0]), max(1, key[1])
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        paint(surf, pygame.Rect(0, 0, key[0], key[1]))
+
+        self._items[key] = surf
+        self._bytes += w * h * 4
+        while len(self._items) > 1 and (len(self._items) > self.max_items or self._bytes > self.max_bytes):
+            _, old = self._items.popitem(last=False)
+            ow, oh = old.get_size()
+            self._bytes -= ow * oh * 4
+            self.evictions += 1
+        return surf
+
+    @staticmethod
+    def draw_all(target: pygame.Surface, items: Iterable[Tuple[pygame.Surface, Tuple[int, int]]]) -> None:
+        seq: List[Tuple[pygame.Surface, Tuple[int, int]]] = list(items)
+        if seq:
+            target.blits(seq, doreturn=False)
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / total) if total else 0.0,
+        }
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+"""startup.py
+
+빠른 시작 경로.
+- pygame.init() 대신 display / font / mixer 만 초기화
+- SysFont 는 매번 시스템 폰트 목록을 스캔 → 찾은 파일 경로를 font_cache.json 에 저장,
+  다음 실행부터 pygame.font.Font(path) 로 바로 로드 (못 찾으면 기본 폰트, 그것도 기억)
+- 단계별 시작 타임라인(main() 진입 기준 ms) → 첫 프레임까지 시간 추적
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+import config
+
+
+class StartupTimeline:
+    def __init__(self) -> None:
+        self.t0 = time.perf_counter()
+        self._last = self.t0
+        self.phases: List[Tuple[str, float]] = []  # (이름, 걸린 ms)
+        self.finished = False
+
+    def mark(self, name: str) -> None:
+        """직전 mark 이후 걸린 시간을 name 단계로 기록."""
+        now = time.perf_counter()
+        self.phases.append((name, (now - self._last) * 1000.0))
+        self._last = now
+
+    def total_ms(self) -> float:
+        return (self._last - self.t0) * 1000.0
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "phases_ms": {name: round(ms, 3) for name, ms in self.phases},
+            "time_to_first_frame_ms": round(self.total_ms(), 3),
+        }
+
+    def finish(self) -> None:
+        """첫 프레임 뒤 한 번: 파일 기록 / 출력 (실패는 무시)."""
+        if self.finished:
+            return
+        self.finished = True
+
+        if config.STARTUP_TIMELINE_PATH:
+            try:
+                Path(config.STARTUP_TIMELINE_PATH).write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+            except Exception:
+                pass
+
+        if config.STARTUP_REPORT:
+            for name, ms in self.phases:
+                print(f"[startup] {name:<12} {ms:8.2f} ms", file=sys.stderr)
+            print(f"[startup] {'total':<12} {self.total_ms():8.2f} ms (첫 프레임까지)", file=sys.stderr)
+
+
+def init_subsystems() -> None:
+    """display / font / mixer 만. mixer 실패는 조용히 넘어감 (플레이어가 disable)."""
+    try:
+        pygame.mixer.pre_init(44100, -16, 1, 512)
+    except Exception:
+        pass
+
+    pygame.display.init()
+    pygame.font.init()
+
+    try:
+        pygame.mixer.init()
+    except Exception:
+        pass
+
+
+def _read_font_cache() -> Dict[str, Dict[str, str]]:
+    try:
+        data = json.loads(Path(config.FONT_CACHE_PATH).read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _write_font_cache(data: Dict[str, Dict[str, str]]) -> None:
+    try:
+        path = Path(config.FONT_CACHE_PATH)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+
+def resolve_font_path(name: str) -> Optional[str]:
+    """name 의 폰트 파일 경로 (None = pygame 기본 폰트). 캐시 → 없으면 match_font 스캔 후 저장."""
+    cache = _read_font_cache()
+    entry = cache.get(name)
+    if isinstance(entry, dict) and entry.get("pygame") == pygame.version.ver:
+        path = entry.get("path") or None
+        if path is None or os.path.isfile(path):
+            return path
+
+    try:
+        path = pygame.font.match_font(name)
+    except Exception:
+        path = None
+
+    cache[name] = {"path": path or "", "pygame": pygame.version.ver}
+    _write_font_cache(cache)
+    return path
+
+
+def load_fonts(name: str, sizes: Sequence[int]) -> List[pygame.font.Font]:
+    """SysFont(name, size) 와 같은 폰트를 캐시된 경로로."""
+    path = resolve_font_path(name)
+    fonts: List[pygame.font.Font] = []
+    for size in sizes:
+        try:
+            fonts.append(pygame.font.Font(path, size))
+        except Exception:
+            fonts.append(pygame.font.Font(None, size))
+    return fonts
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+"""synth.py
+
+BGM/SFX 합성 엔진 (int16 모노 PCM).
+- 오실레이터(sine 배음), 엔벨로프(선형 fade in/out, 지수 감쇠), 코드 믹싱
+- NumPy 가 있으면 샘플 전체를 배열 연산 한 번으로, 없으면 샘플 단위 파이썬 루프
+- 두 경로 모두 연산 순서가 같아서 같은 int16 버퍼가 나옴 (int() 처럼 0 쪽으로 버림)
+"""
+
+import math
+from array import array
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy 없는 환경
+    np = None
+
+# 합성 결과가 바뀌는 수정이면 올림 → audio_cache 키가 바뀌어 옛 캐시 무효화
+SYNTH_VERSION = 1
+
+# (주파수 배수, 가중치)
+Partials = Sequence[Tuple[float, float]]
+
+TONE_PARTIALS: Tuple[Tuple[float, float], ...] = ((1.0, 0.75), (2.0, 0.25))
+
+TWO_PI = 2.0 * math.pi
+
+
+def _clamp(x: float, a: float, b: float) -> float:
+    return a if x < a else b if x > b else x
+
+
+def _use_numpy(use_numpy: Optional[bool]) -> bool:
+    return np is not None if use_numpy is None else (use_numpy and np is not None)
+
+
+# ---- NumPy 경로 ----
+def _np_time(n: int, sr: int):
+    return np.arange(n, dtype=np.float64) / sr
+
+
+def _np_fade(n: int, fade_n: int):
+    """선형 fade in/out 배율 + 적용할 구간 마스크 (구간 밖은 곱하지 않음 → 파이썬 경로와 같은 값)."""
+    i = np.arange(n, dtype=np.float64)
+    env = np.ones(n, dtype=np.float64)
+    if fade_n > 0:
+        head = i < fade_n
+        tail = (~head) & (i > n - fade_n)
+        env[head] = i[head] / fade_n
+        env[tail] = (n - i[tail]) / fade_n
+        return env, head | tail
+    return env, np.zeros(n, dtype=bool)
+
+
+def _np_int16(x) -> "np.ndarray":
+    return np.trunc(x).astype(np.int16)
+
+
+# ---- 공개 API ----
+def tone(
+    freqs: Sequence[float],
+    n: int,
+    sr: int,
+    gain: float,
+    fade_n: int,
+    partials: Partials = TONE_PARTIALS,
+    use_numpy: Optional[bool] = None,
+) -> array:
+    """freqs 를 같은 세기로 섞은 코드 한 스텝 (배음 partials), 앞뒤 선형 fade."""
+    return tone_steps([freqs], n, sr, gain, fade_n, partials, use_numpy)
+
+
+def tone_steps(
+    steps: Iterable[Sequence[float]],
+    n: int,
+    sr: int,
+    gain: float,
+    fade_n: int,
+    partials: Partials = TONE_PARTIALS,
+    use_numpy: Optional[bool] = None,
+) -> array:
+    """길이 n 스텝들을 이어 붙임. t 는 스텝마다 0 부터."""
+    n = max(1, int(n))
+    if fade_n * 2 > n:
+        fade_n = n // 2
+    amp = int(32767 * _clamp(gain, 0.0, 1.0))
+    out = array("h")
+
+    if _use_numpy(use_numpy):
+        t = _np_time(n, sr)
+        env, faded = _np_fade(n, fade_n)
+        for freqs in steps:
+            s = np.zeros(n, dtype=np.float64)
+            for f in freqs:
+                for mult, w in partials:
+                    s += np.sin(TWO_PI * (f * mult) * t) * w
+            s /= max(1, len(freqs))
+            s[faded] *= env[faded]
+            out.frombytes(_np_int16(amp * s).tobytes())
+        return out
+
+    for freqs in steps:
+        mix_div = max(1, len(freqs))
+        for i in range(n):
+            t = i / sr
+            s = 0.0
+            for f in freqs:
+                for mult, w in partials:
+                    s += math.sin(TWO_PI * (f * mult) * t) * w
+            s /= mix_div
+
+            if fade_n > 0:
+                if i < fade_n:
+                    s *= (i / fade_n)
+                elif i > n - fade_n:
+                    s *= ((n - i) / fade_n)
+
+            out.append(int(amp * s))
+    return out
+
+
+def decay_partials(
+    partials: Partials,
+    n: int,
+    sr: int,
+    decay: float,
+    gain: float,
+    use_numpy: Optional[bool] = None,
+) -> array:
+    """sum(sin(2π·f·t)·exp(-t·decay)·w) 를 [-1, 1] 로 자르고 gain 배 (클릭/타격음)."""
+    n = max(1, int(n))
+
+    if _use_numpy(use_numpy):
+        t = _np_time(n, sr)
+        env = np.exp(-t * decay)
+        s = np.zeros(n, dtype=np.float64)
+        for f, w in partials:
+            s += np.sin(TWO_PI * f * t) * env * w
+        np.clip(s, -1.0, 1.0, out=s)
+        return array("h", _np_int16(s * 32767 * gain).tobytes())
+
+    out = array("h")
+    for i in range(n):
+        t = i / sr
+        env = math.exp(-t * decay)
+        s = 0.0
+        for f, w in partials:
+            s += math.sin(TWO_PI * f * t) * env * w
+        out.append(int(_clamp(s, -1.0, 1.0) * 32767 * gain))
+    return out
+
+
+def decay_partials_bank(
+    partials: Partials,
+    ratios: Sequence[float],
+    n: int,
+    sr: int,
+    decay: float,
+    gain: float,
+    use_numpy: Optional[bool] = None,
+) -> List[array]:
+    """decay_partials 를 주파수 배율(ratios)별로 한 번에 (피치 변형 묶음). ratio 1.0 은 원본과 같은 버퍼."""
+    n = max(1, int(n))
+
+    if _use_numpy(use_numpy):
+        t = _np_time(n, sr)
+        env = np.exp(-t * decay)
+        r = np.asarray(ratios, dtype=np.float64)[:, None]
+        s = np.zeros((len(ratios), n), dtype=np.float64)
+        for f, w in partials:
+            s += np.sin(TWO_PI * (f * r) * t) * env * w
+        np.clip(s, -1.0, 1.0, out=s)
+        pcm = _np_int16(s * 32767 * gain)
+        return [array("h", row.tobytes()) for row in pcm]
+
+    return [
+        decay_partials([(f * k, w) for f, w in partials], n, sr, decay, gain, use_numpy=False)
+        for k in ratios
+    ]
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+"""text_cache.py
+
+렌더된 텍스트 surface LRU 캐시.
+- key: (font, text, color, antialias)
+- HUD/hint/flash/게임오버 문구는 프레임 간 거의 안 바뀜 → font.render 생략
+- hits/misses 카운터로 효과 확인
+"""
+
+from collections import OrderedDict
+from typing import Dict, Tuple
+import pygame
+
+Color = Tuple[int, int, int]
+
+
+class TextCache:
+    def __init__(self, capacity: int = 256) -> None:
+        self.capacity = max(1, int(capacity))
+        self._items: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def render(self, font: pygame.font.Font, text: str, color: Color, antialias: bool = True) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        surf = self._items.get(key)
+        if surf is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._items[key] = surf
+        if len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+        return surf
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+        }
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+"""tournament.py
+
+오토플레이 policy × seed 토너먼트 (프로세스 풀, 전 코어).
+- simulator.Simulator(기존 spawner/update 메카닉) 로 한 판씩 실행
+- seed 묶음(chunk) 단위로 작업 분배
+- 런마다 seed 로 random 을 다시 시드 → 어느 워커가 돌려도 결과 동일(재현 가능)
+
+- aligned 처럼 거의 안 죽는 policy 를 위해 기본 --max-blocks 500, game over 못 한 런은 truncated 로 따로 셈
+
+python tournament.py --policies aligned,sloppy --seeds 10000 --csv out.csv
+"""
+
+import argparse
+import csv
+import os
+import random
+import re
+import sys
+import time
+from multiprocessing import Pool
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from simulator import POLICIES, Simulator
+
+Row = Tuple[str, int, int, int, int, bool]  # policy, seed, score, perfect, max_combo, game_over
+Task = Tuple[str, Sequence[int], Optional[int], int]
+
+DEFAULT_MAX_BLOCKS = 500
+DEFAULT_MAX_STEPS = 1_000_000
+
+
+def _worker_init() -> None:
+    # 런마다 reset(seed) 로 덮어쓰지만, 혹시 모를 시드 전 소비도 워커 간 동일하게
+    random.seed(0)
+
+
+def _run_chunk(task: Task) -> List[Row]:
+    policy_name, seeds, max_blocks, max_steps = task
+    sim = Simulator()
+    rows: List[Row] = []
+    for seed in seeds:
+        r = sim.run(POLICIES[policy_name](), seed=seed, max_blocks=max_blocks, max_steps=max_steps)
+        rows.append((policy_name, seed, r.score, r.perfect, r.max_combo, r.game_over))
+    return rows
+
+
+def make_tasks(
+    policies: Sequence[str],
+    seeds: Sequence[int],
+    chunk_size: int,
+    max_blocks: Optional[int],
+    max_steps: int = DEFAULT_MAX_STEPS,
+) -> Iterator[Task]:
+    chunk_size = max(1, int(chunk_size))
+    for name in policies:
+        for i in range(0, len(seeds), chunk_size):
+            yield (name, list(seeds[i:i + chunk_size]), max_blocks, max_steps)
+
+
+def run_tournament(
+    policies: Sequence[str],
+    seeds: Sequence[int],
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
+    max_blocks: Optional[int] = DEFAULT_MAX_BLOCKS,
+    max_steps: int = DEFAULT_MAX_STEPS,
+) -> List[Row]:
+    """결과는 (policy 입력 순서, seed) 로 정렬해서 반환 → 출력이 스케줄링과 무관."""
+    unknown = [p for p in policies if p not in POLICIES]
+    if unknown:
+        raise ValueError(f"unknown policies: {', '.join(unknown)}")
+
+    tasks = list(make_tasks(policies, seeds, chunk_size, max_blocks, max_steps))
+    rows: List[Row] = []
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for t in tasks:
+            rows.extend(_run_chunk(t))
+    else:
+        with Pool(processes=workers, initializer=_worker_init) as pool:
+            for chunk in pool.imap_unordered(_run_chunk, tasks):
+                rows.extend(chunk)
+
+    order = {name: i for i, name in enumerate(policies)}
+    rows.sort(key=lambda r: (order[r[0]], r[1]))
+    return rows
+
+
+def summarize(rows: Sequence[Row]) -> Dict[str, Dict[str, float]]:
+    out: Dict[str, Dict[str, float]] = {}
+    by_policy: Dict[str, List[Row]] = {}
+    for r in rows:
+        by_policy.setdefault(r[0], []).append(r)
+
+    for name, rs in by_policy.items():
+        scores = sorted(r[2] for r in rs)
+        n = len(rs)
+        out[name] = {
+            "runs": n,
+            "score_mean": sum(scores) / n,
+            "score_p50": scores[n // 2],
+            "score_max": scores[-1],
+            "perfect_mean": sum(r[3] for r in rs) / n,
+            "max_combo_max": max(r[4] for r in rs),
+            "truncated": sum(1 for r in rs if not r[5]),
+        }
+    return out
+
+
+_RANGE_RE = re.compile(r"^(-?\d+)(?:\.\.|:)(-?\d+)$")
+_LEGACY_RANGE_RE = re.compile(r"^(\d+)-(\d+)$")
+
+
+def _parse_seeds(spec: str, base: int) -> List[int]:
+    """"1000" → base..base+999, "5..9" / "5:9" / "5-9" → 5..9 (음수는 "-5..5"), "1,-4,7" → 목록.
+
+    형식이 틀리면 ValueError.
+    """
+    spec = spec.strip()
+    m = _RANGE_RE.match(spec) or _LEGACY_RANGE_RE.match(spec)
+    if m:
+        a, b = int(m.group(1)), int(m.group(2))
+        if b < a:
+            raise ValueError(f"empty seed range: {spec}")
+        return list(range(a, b + 1))
+    if "," in spec:
+        return [int(s) for s in spec.split(",") if s.strip()]
+    n = int(spec)
+    if n < 0:
+        raise ValueError(f"seed count must be >= 0: {spec}")
+    return list(range(base, base + n))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="One More Block autoplay tournament")
+    ap.add_argument("--policies", default=",".join(POLICIES), help="comma separated: " + ", ".join(POLICIES))
+    ap.add_argument("--seeds", default="1000", help="count, a..b (or a:b) range, or comma list; negatives allowed")
+    ap.add_argument("--base-seed", type=int, default=0)
+    ap.add_argument("--workers", type=int, default=0, help="0 = all cores")
+    ap.add_argument("--chunk", type=int, default=64)
+    ap.add_argument("--max-blocks", type=int, default=DEFAULT_MAX_BLOCKS, help="0 = until game over (still capped by --max-steps)")
+    ap.add_argument("--max-steps", type=int, default=DEFAULT_MAX_STEPS, help="simulation steps per run")
+    ap.add_argument("--csv", default="", help="write per-run table here")
+    args = ap.parse_args(argv)
+
+    policies = [p.strip() for p in args.policies.split(",") if p.strip()]
+    try:
+        seeds = _parse_seeds(args.seeds, args.base_seed)
+    except ValueError:
+        ap.error(f"invalid --seeds: {args.seeds!r}")
+
+    t0 = time.perf_counter()
+    try:
+        rows = run_tournament(
+            policies,
+            seeds,
+            workers=args.workers or None,
+            chunk_size=args.chunk,
+            max_blocks=args.max_blocks or None,
+            max_steps=args.max_steps,
+        )
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - t0
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["policy", "seed", "score", "perfect", "max_combo", "game_over"])
+            w.writerows((p, seed, score, perf, combo, int(over)) for p, seed, score, perf, combo, over in rows)
+
+    print(f"{len(rows)} runs in {elapsed:.2f}s")
+    print(f"{'policy':<10} {'runs':>7} {'mean':>8} {'p50':>6} {'max':>6} {'perfect':>8} {'combo':>6} {'trunc':>6}")
+    for name, s in summarize(rows).items():
+        print(
+            f"{name:<10} {int(s['runs']):>7} {s['score_mean']:>8.2f} {int(s['score_p50']):>6} "
+            f"{int(s['score_max']):>6} {s['perfect_mean']:>8.2f} {int(s['max_combo_max']):>6} {int(s['truncated']):>6}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,17 +2,24 @@ from __future__ import annotations
 
 """update.py
 
-- shards는 game_over여도 계속 떨어지게 유지
+- shards는 game_over여도 계속 떨어지게 유지 (위치는 sim_time 기준 해석식, 여기선 만료만)
 - 실패 시 현재 블록 전체를 shard로 떨어뜨려 "안 떨어짐" 이슈 방지
 - PERFECT 시 effects.trigger_perfect() 호출
 """
 
+from typing import Optional
+
 from mechanics import compute_overlap, get_top_block, top_surface_y
-from models import BlockShard, GameState
+from models import Block, BlockShard, GameState
 from spawner import spawn_next_block
 from effects import trigger_perfect
 
 
+def _add_shard(state: GameState, cur: Block, x: float, w: float, y: float, vy: float, gravity: float, y_limit: float) -> None:
+    s = BlockShard(x=x, y=y, w=w, h=cur.h, color=cur.color, vy=vy, t0=state.sim_time, gravity=gravity)
+    state.shards.add(s, y_limit)
+
+
 def update_game(
     state: GameState,
     dt: float,
@@ -30,13 +37,11 @@ def update_game(
     combo_bonus: int,
     shard_gravity: float,
     shard_fall_speed: float,
+    view_bottom_y: Optional[float] = None,
 ) -> None:
-    # shards는 항상 업데이트
-    for s in state.shards[:]:
-        s.vy += shard_gravity * dt
-        s.y += s.vy * dt
-        if s.y > floor_y + 300:
-            state.shards.remove(s)
+    # shards: 화면(view_bottom_y) 또는 바닥+300 아래로 빠진 것만 만료
+    state.sim_time += dt
+    state.shards.expire(state.sim_time)
 
     if state.game_over:
         return
@@ -80,6 +85,10 @@ def update_game(
         shard_y = land_y
         cur.y = land_y
 
+        shard_limit = floor_y + 300
+        if view_bottom_y is not None:
+            shard_limit = min(shard_limit, view_bottom_y)
+
         top = get_top_block(state)
         if top is None:
             state.game_over = True
@@ -90,9 +99,7 @@ def update_game(
 
         # 실패: 현재 블록 전체를 shard로
         if ratio < min_overlap_ratio or overlap_w <= 0.0:
-            state.shards.append(
-                BlockShard(x=cur.x, y=shard_y, w=cur.w, h=cur.h, color=cur.color, vy=shard_fall_speed)
-            )
+            _add_shard(state, cur, cur.x, cur.w, shard_y, shard_fall_speed, shard_gravity, shard_limit)
             state.current = None
             state.game_over = True
             state.best = max(state.best, state.score)
@@ -107,19 +114,15 @@ def update_game(
         new_right = overlap_left + overlap_w
 
         if new_left > orig_left:
-            state.shards.append(
-                BlockShard(x=orig_left, y=shard_y, w=new_left - orig_left, h=cur.h, color=cur.color, vy=shard_fall_speed)
-            )
+            _add_shard(state, cur, orig_left, new_left - orig_left, shard_y, shard_fall_speed, shard_gravity, shard_limit)
 
         if new_right < orig_right:
-            state.shards.append(
-                BlockShard(x=new_right, y=shard_y, w=orig_right - new_right, h=cur.h, color=cur.color, vy=shard_fall_speed)
-            )
+            _add_shard(state, cur, new_right, orig_right - new_right, shard_y, shard_fall_speed, shard_gravity, shard_limit)
 
         cur.x = new_left
         cur.w = overlap_w
         cur.phase = "settled"
-        state.stack.append(cur)
+        state.push_block(cur)
 
         state.score += 1
 